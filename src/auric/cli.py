@@ -191,8 +191,15 @@ def start():
     # Initialize FastAPI (TUI is initialized inside run_daemon if None)
     api_app = FastAPI(title="OpenAuric API")
     
+    # uvloop (libuv-backed) is used when available; it is not built for Windows
     try:
-        asyncio.run(run_daemon(tui_app=None, api_app=api_app))
+        import uvloop
+        run_loop = uvloop.run
+    except ImportError:
+        run_loop = asyncio.run
+
+    try:
+        run_loop(run_daemon(tui_app=None, api_app=api_app))
     except KeyboardInterrupt:
         pass # Clean exit handled by finally/atexit
     except Exception as e:
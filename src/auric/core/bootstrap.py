@@ -16,6 +16,7 @@ logger = logging.getLogger("auric.bootstrap")
 # Constants
 PKG_ROOT = Path(__file__).resolve().parent.parent 
 DEFAULT_SPELLS_DIR = PKG_ROOT / "spells" / "default"
+STATIC_DIR = PKG_ROOT / "interface" / "server" / "static"
 
 FILES_TO_COPY = {
     "AGENT.md": "AGENT.md",
@@ -41,6 +42,11 @@ def ensure_workspace() -> None:
     (AURIC_ROOT / "memories").mkdir(exist_ok=True)
     (AURIC_ROOT / "workspace").mkdir(exist_ok=True)
 
+    # Web UI static assets (mounted by the daemon without re-checking)
+    if not STATIC_DIR.exists():
+        logger.warning(f"Static path {STATIC_DIR} not found. Creating...")
+        STATIC_DIR.mkdir(parents=True, exist_ok=True)
+
     if not AURIC_TEMPLATES_DIR.exists():
         logger.warning(f"Templates directory not found at {AURIC_TEMPLATES_DIR}. Cannot bootstrap workspace.")
         return
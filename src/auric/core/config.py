@@ -58,6 +58,9 @@ class HeartbeatConfig(BaseModel):
     interval: str = "30m"
     active_hours: str = Field(default="09:00-18:00", alias="activeHours")
     target: str = "console"
+    # Stretch the interval (up to max_interval) while ticks find nothing to do
+    adaptive: bool = False
+    max_interval: str = "2h"
 
 class LoggingConfig(BaseModel):
     """Configuration for system-wide JSONL logging."""
@@ -101,6 +104,9 @@ class GatewayConfig(BaseModel):
     host: str = "127.0.0.1"
     web_ui_token: Optional[str] = None
     disable_access_log: bool = False
+    # Uvicorn workers. The daemon shares its buses and buffers with the API
+    # in-process, so only 1 is supported until the buses move out of process.
+    workers: int = 1
 
 class SandboxConfig(BaseModel):
     """Configuration for the isolated Python sandbox."""
@@ -110,6 +116,11 @@ class SandboxConfig(BaseModel):
 class TelegramConfig(BaseModel):
     enabled: bool = False
     token: Optional[str] = None
+    # Public HTTPS URL Telegram should push updates to; long polling when unset.
+    # Needs the webhooks extra: pip install "python-telegram-bot[webhooks]"
+    webhook_url: Optional[str] = None
+    webhook_listen: str = "0.0.0.0"
+    webhook_port: int = 8443
 
 class DiscordConfig(BaseModel):
     enabled: bool = False
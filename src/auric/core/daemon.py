@@ -13,34 +13,327 @@ sharing memory and state (like the internal event bus).
 import asyncio
 import logging
 import os
+import queue
+import sys
+import threading
+import time
 from collections import deque
-from typing import Optional, Deque, Dict, Any
+from dataclasses import dataclass
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Optional, Coroutine, Deque, Dict, Any, Iterator, List, Mapping, Set, Tuple
 from uuid import uuid4
 from pathlib import Path
 
+import orjson
 from textual.app import App
 from uvicorn import Config, Server
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 
 from .config import load_config, AURIC_ROOT
 from .database import AuditLogger
 # from auric.interface.tui.app import AuricTUI # TUI Disabled
 from auric.interface.server.routes import router as dashboard_router
+from auric.interface.server.static_files import CachedStaticFiles
 from rich.console import Console
 from rich.text import Text
-from datetime import datetime
 
 logger = logging.getLogger("auric.daemon")
-console = Console()
+# Under systemd/docker stdout is usually a pipe: skip Rich rendering there
+_STDOUT_IS_TTY = sys.stdout.isatty()
+# Lines are pre-styled plain text: no markup, highlighting or re-wrapping
+console = Console(no_color=not _STDOUT_IS_TTY, highlight=False, markup=False, soft_wrap=True)
+
+# Encoded "] [LEVEL] " separators for the plain (non-TTY) console path
+_LEVEL_PREFIXES: Dict[str, bytes] = {}
+
+def _plain_line(timestamp: str, level: str, text: str, more: bool = False) -> bytes:
+    """Builds one encoded console line without intermediate string formatting."""
+    prefix = _LEVEL_PREFIXES.get(level)
+    if prefix is None:
+        prefix = _LEVEL_PREFIXES[level] = f"] [{level}] ".encode()
+    return b"".join((
+        b"[", timestamp.encode(), prefix, text.encode("utf-8", "replace"),
+        b" (more...)\n" if more else b"\n",
+    ))
+
+# "%H:%M:%S" only changes once a second, so format it at most once a second
+_hms_cache: List[Any] = [-1, ""]
+
+def _now_hms() -> str:
+    """Returns the local time as HH:MM:SS, cached per wall-clock second."""
+    now = int(time.time())
+    if now != _hms_cache[0]:
+        _hms_cache[0] = now
+        _hms_cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
+    return _hms_cache[1]
+
+# Console output is rendered on a dedicated thread so the dispatcher never
+# blocks the event loop on ANSI encoding or TTY writes.
+_console_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+_console_thread: Optional[threading.Thread] = None
+
+def _console_writer(q: "queue.SimpleQueue[Any]") -> None:
+    """Drains the console queue, printing each pending batch in one buffered write."""
+    while True:
+        batch = [q.get()]
+        while True:
+            try:
+                batch.append(q.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            if _STDOUT_IS_TTY:
+                # One buffered write (and one lock acquisition) per batch
+                with console:
+                    for renderable in batch:
+                        console.print(renderable)
+            else:
+                # Pre-encoded lines, written straight to the byte stream
+                out = sys.stdout
+                data = b"".join(batch)
+                buffer = getattr(out, "buffer", None)
+                out.flush()
+                if buffer is not None:
+                    buffer.write(data)
+                    buffer.flush()
+                else:
+                    out.write(data.decode("utf-8", "replace"))
+                    out.flush()
+        except Exception as e:
+            logger.error(f"Console Writer Error: {e}")
+
+def _start_console_writer() -> None:
+    """Starts the console writer thread (once per process)."""
+    global _console_thread
+    if _console_thread is None or not _console_thread.is_alive():
+        _console_thread = threading.Thread(
+            target=_console_writer, args=(_console_queue,), name="auric-console", daemon=True
+        )
+        _console_thread.start()
+
+class FastChannel:
+    """
+    Single-consumer channel for the command bus.
+
+    Producers (Web, Pacts, Heartbeat) all live on the daemon's event loop and
+    only the brain consumes, so a deque plus one parked waiter replaces
+    asyncio.Queue's getter bookkeeping. Exposes the subset of the Queue API
+    the producers use (`put`, `put_nowait`, `get`, `empty`, `full`, `qsize`).
+
+    With a `maxsize`, `put` waits while the channel is full so a burst of
+    inputs backs up at the producers instead of growing without bound.
+    """
+
+    __slots__ = ("_dq", "_waiter", "_maxsize", "_putters")
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self._dq: Deque[Any] = deque()
+        self._waiter: Optional[asyncio.Future] = None
+        self._maxsize = maxsize
+        self._putters: Deque[asyncio.Future] = deque()
+
+    def put_nowait(self, item: Any) -> None:
+        if self.full():
+            raise asyncio.QueueFull
+        self._dq.append(item)
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def put(self, item: Any) -> None:
+        while self.full():
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except asyncio.CancelledError:
+                # Woken and cancelled at once: hand the free slot to the next producer
+                if putter.done() and not putter.cancelled():
+                    self._wake_putter()
+                raise
+        self.put_nowait(item)
+
+    async def get(self) -> Any:
+        while not self._dq:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        item = self._dq.popleft()
+        if self._putters:
+            self._wake_putter()
+        return item
+
+    def _wake_putter(self) -> None:
+        while self._putters:
+            putter = self._putters.popleft()
+            if not putter.done():
+                putter.set_result(None)
+                return
+
+    def empty(self) -> bool:
+        return not self._dq
+
+    def full(self) -> bool:
+        return 0 < self._maxsize <= len(self._dq)
+
+    def qsize(self) -> int:
+        return len(self._dq)
+
+class RingBuffer:
+    """
+    Fixed-capacity buffer for the web chat/log history.
+
+    Appends overwrite the oldest slot of a preallocated list, so steady-state
+    appends allocate nothing, and `snapshot()` returns the contents oldest
+    first in at most two slices. Iteration, `len()` and `clear()` match the
+    `deque(maxlen=...)` it replaces.
+    """
+
+    __slots__ = ("_buf", "_idx", "_cap", "_full")
+
+    def __init__(self, capacity: int) -> None:
+        self._cap = capacity
+        self._buf: List[Any] = [None] * capacity
+        self._idx = 0
+        self._full = False
+
+    def append(self, item: Any) -> None:
+        self._buf[self._idx] = item
+        self._idx += 1
+        if self._idx == self._cap:
+            self._idx = 0
+            self._full = True
+
+    def snapshot(self) -> List[Any]:
+        """Returns the buffered items, oldest first."""
+        if self._full:
+            return self._buf[self._idx:] + self._buf[:self._idx]
+        return self._buf[:self._idx]
+
+    def clear(self) -> None:
+        self._buf = [None] * self._cap
+        self._idx = 0
+        self._full = False
+
+    def __len__(self) -> int:
+        return self._cap if self._full else self._idx
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.snapshot())
+
+@dataclass(slots=True, frozen=True)
+class LogMsg:
+    """
+    A message on the internal bus (Brain/System -> Dispatcher).
+
+    Fields are read by attribute in the dispatcher, and orjson serializes the
+    dataclass natively for the web chat buffer.
+    """
+    level: str
+    message: str
+    source: str = "BRAIN"
+    session_id: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, msg: Dict[str, Any]) -> "LogMsg":
+        """Converts a legacy dict message into a LogMsg."""
+        return cls(
+            level=msg.get("level") or "INFO",
+            message=msg.get("message", str(msg)),
+            source=msg.get("source") or "BRAIN",
+            session_id=msg.get("session_id"),
+        )
+
+# Console style per message level (TTY only)
+_LEVEL_STYLES: Mapping[str, str] = MappingProxyType({
+    "ERROR": "bold red",
+    "WARNING": "yellow",
+    "THOUGHT": "dim cyan",
+    "AGENT": "green",
+    "USER": "blue",
+    "HEARTBEAT": "magenta",
+    "TOOL": "bold yellow",
+})
+
+# Levels that belong in the chat history (and the DB)
+_CHAT_LEVELS = frozenset(("USER", "AGENT", "THOUGHT", "HEARTBEAT", "TOOL"))
 
 class EndpointFilter(logging.Filter):
     """
     Filter out health checks and status polling from access logs.
+
+    Uvicorn passes the request path as the third record arg
+    (client_addr, method, path, http_version, status), so it is checked
+    directly instead of formatting the message first.
     """
+    QUIET_PATHS = ("/api/status", "/api/sessions")
+
     def filter(self, record: logging.LogRecord) -> bool:
-        return record.getMessage().find("/api/status") == -1 and record.getMessage().find("/api/sessions") == -1
+        args = record.args
+        if isinstance(args, tuple) and len(args) >= 3 and isinstance(args[2], str):
+            return not args[2].startswith(self.QUIET_PATHS)
+        message = record.getMessage()
+        return not any(path in message for path in self.QUIET_PATHS)
+
+# Duration suffix -> APScheduler interval trigger keyword
+_DURATION_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
+
+def _parse_duration(value: str) -> Optional[Dict[str, int]]:
+    """Parses "30m"/"1h"/"15s"/"1d" into interval trigger kwargs; None if invalid."""
+    unit = _DURATION_UNITS.get(value[-1:])
+    amount = value[:-1]
+    if unit is None or not amount.isdigit():
+        return None
+    return {unit: int(amount)}
+
+def _parse_clock(value: str) -> Optional[Tuple[int, int]]:
+    """Parses a 24h "HH:MM" time into (hour, minute); None if invalid."""
+    hour, sep, minute = value.partition(":")
+    if not (sep and hour.isdigit() and minute.isdigit()):
+        return None
+    hour_i, minute_i = int(hour), int(minute)
+    if hour_i > 23 or minute_i > 59:
+        return None
+    return hour_i, minute_i
+
+# Seconds Uvicorn gets to finish in-flight requests before it is cancelled
+API_SHUTDOWN_TIMEOUT = 5.0
+
+# Bus capacities: producers wait (backpressure) once a bus is this full
+COMMAND_BUS_MAXSIZE = 256
+INTERNAL_BUS_MAXSIZE = 1024
+
+# How often the idle-only WAL checkpoint job runs
+WAL_CHECKPOINT_INTERVAL_MINUTES = 30
+
+# Brain-loop message classification.
+# Each handler unpacks a command_bus item into
+# (user_msg, source, platform, sender_id); unknown shapes are ignored.
+ClassifiedItem = Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]
+
+def _handle_web(item: Dict[str, Any]) -> ClassifiedItem:
+    """Message from Web UI, CLI or Heartbeat."""
+    return item.get("message"), item.get("source", "WEB"), None, None
+
+def _handle_pact(item: Dict[str, Any]) -> ClassifiedItem:
+    """Message from a Pact (Discord/Telegram)."""
+    event = item.get("event")
+    if not event:
+        return None, None, None, None
+    # Prepend User Identity
+    sender_name = event.metadata.get("author_display") or event.metadata.get("author_name") or "User"
+    return f"{sender_name}: {event.content}", "PACT", event.platform, event.sender_id
+
+# Keyed on (item["level"], item["type"])
+_SOURCE_HANDLERS = {
+    ("USER", None): _handle_web,
+    (None, "user_query"): _handle_pact,
+}
+
 
 async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
     """
@@ -61,31 +354,39 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
         config.gateway.web_ui_token = token
         ConfigLoader.save(config)
         logger.warning(f"Generated new Web UI Token: {token}")
-        console.print(f"[bold yellow]Generated new Web UI Token: {token}[/bold yellow]")
+        console.print(f"Generated new Web UI Token: {token}", style="bold yellow")
         console.print("Use 'auric token' to retrieve it later.")
 
     logger.info(f"Starting Auric Daemon (PID {os.getpid()})...")
     
     # 0. Bootstrap Workspace
-    from auric.core.bootstrap import ensure_workspace
+    from auric.core.bootstrap import ensure_workspace, STATIC_DIR
     ensure_workspace()
 
     # 1. Setup Internal Buses
     # `command_bus`: Inputs from Users (TUI, API, Pacts) -> Brain
     # `internal_bus`: Raw Output from Brain/System -> Dispatcher
-    command_bus: asyncio.Queue = asyncio.Queue()
-    internal_bus: asyncio.Queue = asyncio.Queue()
+    command_bus = FastChannel(maxsize=COMMAND_BUS_MAXSIZE)
+    internal_bus: asyncio.Queue = asyncio.Queue(maxsize=INTERNAL_BUS_MAXSIZE)
     
+    # Every task the daemon spawns, so shutdown can cancel and reap them all
+    background_tasks: Set[asyncio.Task] = set()
+
+    def spawn(coro: Coroutine[Any, Any, Any], name: str) -> asyncio.Task:
+        task = asyncio.create_task(coro, name=name)
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+        return task
+
     # Consumers
     # tui_bus: asyncio.Queue = asyncio.Queue() # TUI Disabled
-    web_chat_history: Deque[Dict[str, Any]] = deque(maxlen=50) # Recent chat
-    web_log_buffer: Deque[str] = deque(maxlen=100) # Raw logs
+    web_chat_history = RingBuffer(50) # Recent chat (pre-serialized JSON)
+    web_log_buffer = RingBuffer(100) # Raw logs (preformatted, pre-serialized JSON strings)
     
     # Inject buses into API state
     api_app.state.command_bus = command_bus
     api_app.state.web_chat_history = web_chat_history
     api_app.state.web_log_buffer = web_log_buffer
-    api_app.state.web_log_buffer = web_log_buffer
     api_app.state.config = config
     
     # Initialize active session later after DB load
@@ -110,13 +411,8 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
-    # Mount static files
-    static_path = Path(__file__).parent.parent / "interface" / "server" / "static"
-    if not static_path.exists():
-        logger.warning(f"Static path {static_path} not found. Creating...")
-        static_path.mkdir(parents=True, exist_ok=True)
-        
-    api_app.mount("/", StaticFiles(directory=str(static_path), html=True), name="static")
+    # Mount static files (directory is created by ensure_workspace; assets are cached in memory)
+    api_app.mount("/", CachedStaticFiles(directory=str(STATIC_DIR), html=True, check_dir=False), name="static")
 
     # 2. Setup Scheduler (Heartbeat & Dream Cycle)
     # 2. Setup Scheduler (Heartbeat & Dream Cycle)
@@ -127,6 +423,10 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
     await audit_logger.init_db()
     api_app.state.audit_logger = audit_logger
 
+    # Sessions known to exist in the DB, so the brain can skip the lookup per PACT message
+    known_sessions: Set[str] = await audit_logger.get_session_ids()
+    api_app.state.known_sessions = known_sessions
+
     # Load Last Session
     last_session_id = await audit_logger.get_last_active_session_id()
     if last_session_id:
@@ -138,30 +438,40 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
         logger.info(f"Starting new session: {new_sid}")
 
     # 2.1 Initialize HeartbeatManager with Logger (Singleton)
-    from auric.core.heartbeat import HeartbeatManager, run_heartbeat_task
-    # Singleton Init
-    HeartbeatManager(audit_logger)
+    from auric.core.heartbeat import HeartbeatBackoff, HeartbeatManager, run_heartbeat_task, run_wal_checkpoint_task
+    HeartbeatManager.get_instance().audit_logger = audit_logger
 
     # 2.2 Schedule Heartbeat
-    if config.agents.defaults.heartbeat.enabled:
-        interval_str = config.agents.defaults.heartbeat.interval
-        kwargs = {}
-        try:
-            if interval_str.endswith("m"):
-                 kwargs["minutes"] = int(interval_str[:-1])
-            elif interval_str.endswith("h"):
-                 kwargs["hours"] = int(interval_str[:-1])
-            elif interval_str.endswith("s"):
-                 kwargs["seconds"] = int(interval_str[:-1])
-            else:
-                 logger.warning(f"Invalid heartbeat interval '{interval_str}', defaulting to 30m")
-                 kwargs["minutes"] = 30
-        except ValueError:
-             logger.warning(f"Could not parse heartbeat interval '{interval_str}', defaulting to 30m")
-             kwargs["minutes"] = 30
-             
-        scheduler.add_job(run_heartbeat_task, 'interval', args=[command_bus], **kwargs)
-        logger.info(f"Heartbeat scheduled every {interval_str}.")
+    heartbeat_config = config.agents.defaults.heartbeat
+    if heartbeat_config.enabled:
+        interval_str = heartbeat_config.interval
+        kwargs = _parse_duration(interval_str)
+        if kwargs is None:
+            logger.warning(f"Invalid heartbeat interval '{interval_str}', defaulting to 30m")
+            kwargs = {"minutes": 30}
+
+        backoff = None
+        if heartbeat_config.adaptive:
+            max_kwargs = _parse_duration(heartbeat_config.max_interval)
+            if max_kwargs is None:
+                logger.warning(f"Invalid heartbeat max_interval '{heartbeat_config.max_interval}', defaulting to 2h")
+                max_kwargs = {"hours": 2}
+            backoff = HeartbeatBackoff(
+                scheduler, "heartbeat",
+                timedelta(**kwargs).total_seconds(), timedelta(**max_kwargs).total_seconds()
+            )
+
+        scheduler.add_job(
+            run_heartbeat_task, 'interval', args=[command_bus], kwargs={"backoff": backoff},
+            id="heartbeat", **kwargs
+        )
+        logger.info(f"Heartbeat scheduled every {interval_str}{' (adaptive)' if backoff else ''}.")
+
+    # 2.3 Truncate the SQLite WAL while idle (autocheckpoint only runs every 2000 pages)
+    scheduler.add_job(
+        run_wal_checkpoint_task, 'interval', args=[audit_logger],
+        id="wal_checkpoint", minutes=WAL_CHECKPOINT_INTERVAL_MINUTES
+    )
 
     scheduler.start()
     logger.info("Scheduler started.")
@@ -174,13 +484,21 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
 
     # 4. Setup FastAPI (Uvicorn)
     # We must run Uvicorn manually to keep it in our existing asyncio loop.
-
+    # Multiple workers would each get their own process without the command_bus,
+    # web buffers or brain, so the API always runs as a single in-process worker.
+    gateway_config = config.gateway
+    host, port = gateway_config.host, gateway_config.port
+    if gateway_config.workers > 1:
+        logger.warning(
+            f"gateway.workers={gateway_config.workers} is not supported: the API shares "
+            "in-process buses with the brain. Running a single worker."
+        )
 
     uvi_config = Config(
         app=api_app, 
-        host=config.gateway.host,
-        port=config.gateway.port, 
-        loop="asyncio",
+        host=host,
+        port=port,
+        loop="auto", # Serving on our running loop; uvloop when cli start installed it
         log_level="info" if logger.level <= logging.INFO else "warning",
     )
     server = Server(uvi_config)
@@ -200,13 +518,13 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
     # Launch server as a background task
     # Apply filter to uvicorn access log
     access_logger = logging.getLogger("uvicorn.access")
-    if config.gateway.disable_access_log:
+    if gateway_config.disable_access_log:
         access_logger.disabled = True
     else:
         access_logger.addFilter(EndpointFilter())
     
-    api_task = asyncio.create_task(safe_serve())
-    logger.info(f"API Server starting on {config.gateway.host}:{config.gateway.port}")
+    api_task = spawn(safe_serve(), name="uvicorn.serve")
+    logger.info(f"API Server starting on {host}:{port}")
 
     # 5. Initialize Brain (RLM Engine) & Dependencies
     # Dependencies
@@ -217,15 +535,24 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
     from auric.spells.tool_registry import ToolRegistry
     from auric.core.session_router import SessionRouter
 
-    gateway = LLMGateway(config, audit_logger=audit_logger)
-    
-    librarian = GrimoireLibrarian()
+    # Construct the independent heavy dependencies in worker threads so cold start
+    # costs the slowest of them rather than the sum. Imports stay on this thread
+    # (concurrent imports of the same packages can deadlock the import lock).
+    async def build_memory_and_tools():
+        librarian = await asyncio.to_thread(GrimoireLibrarian)
+        tool_registry = await asyncio.to_thread(ToolRegistry, config, librarian=librarian)
+        return librarian, tool_registry
+
+    gateway, (librarian, tool_registry) = await asyncio.gather(
+        asyncio.to_thread(LLMGateway, config, audit_logger=audit_logger),
+        build_memory_and_tools(),
+    )
+    # Watchers bind to the running loop, so start on the loop thread
     librarian.start()
     
     focus_path = AURIC_ROOT / "memories" / "FOCUS.md"
     focus_manager = FocusManager(focus_path) # Assumes file exists or handled by engine
     
-    tool_registry = ToolRegistry(config, librarian=librarian)
     session_router = SessionRouter(AURIC_ROOT / "active_sessions.json")
     
     # Inject into API state and add reload endpoint
@@ -235,7 +562,7 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
     api_app.state.session_router = session_router
 
     # Trigger initial re-indexing (background task)
-    asyncio.create_task(librarian.start_reindexing())
+    spawn(librarian.start_reindexing(), name="librarian.reindex")
 
     # Schedule periodic re-indexing (e.g., every hour)
     scheduler.add_job(librarian.start_reindexing, 'interval', hours=1)
@@ -250,11 +577,11 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
 
     # Callback for RLM logging
     async def log_to_bus(level: str, message: str):
-         await internal_bus.put({
-             "level": level,
-             "message": message,
-             "source": "BRAIN"
-         })
+         await internal_bus.put(LogMsg(
+             level=level,
+             message=message,
+             source="BRAIN"
+         ))
 
     rlm_engine = RLMEngine(
         config=config,
@@ -270,8 +597,9 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
     from auric.memory.chronicles import perform_dream_cycle
     
     dream_time_str = config.agents.dream_time
-    try:
-        hour, minute = map(int, dream_time_str.split(':'))
+    dream_time = _parse_clock(dream_time_str)
+    if dream_time is not None:
+        hour, minute = dream_time
         scheduler.add_job(
             perform_dream_cycle, 
             'cron', 
@@ -280,75 +608,93 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
             args=[audit_logger, gateway, config]
         )
         logger.info(f"Dream Cycle scheduled for {dream_time_str} daily.")
-    except ValueError:
+    else:
         logger.error(f"Invalid dream_time format '{dream_time_str}'. Expected HH:MM. Dream Cycle disabled.")
 
     # 6. Start Brain Loop & Dispatcher
+    _start_console_writer()
+
+    def dispatch_message(msg: Any) -> Optional[Tuple[str, str, Optional[str]]]:
+        """Echoes a message to console and web buffers; returns its chat row if it should be persisted."""
+        if isinstance(msg, dict):
+            msg = LogMsg.from_dict(msg)
+
+        if not isinstance(msg, LogMsg):
+            # Raw string
+            text = str(msg)
+            if _STDOUT_IS_TTY:
+                _console_queue.put_nowait(text)
+            else:
+                _console_queue.put_nowait(text.encode("utf-8", "replace") + b"\n")
+            web_log_buffer.append(orjson.dumps(text))
+            return None
+
+        level = msg.level
+        text = msg.message
+
+        # 1. Send to Console (stdout)
+        timestamp = _now_hms()
+        line_text = text
+        more = False
+        if level == "THOUGHT":
+            # Truncate thoughts for console clarity (first line only)
+            first_line, newline, _ = text.partition('\n')
+            if len(first_line) > 100:
+                first_line = first_line[:97] + "..."
+            line_text = first_line
+            more = bool(newline) or len(text) > 100
+        if _STDOUT_IS_TTY:
+            text_obj = Text(f"[{timestamp}] [{level}] {line_text}")
+            if more:
+                text_obj.append(" (more...)", style="dim")
+            text_obj.stylize(_LEVEL_STYLES.get(level, "white"))
+            _console_queue.put_nowait(text_obj)
+        else:
+            _console_queue.put_nowait(_plain_line(timestamp, level, line_text, more))
+
+        # 2. Store in Web Buffers & Database
+        web_log_buffer.append(orjson.dumps(f"[{level}] {text}"))
+
+        # Chat History filters
+        if level in _CHAT_LEVELS:
+            # Only show non-heartbeat messages in the Web UI Chat
+            # Heartbeats are still logged to DB below
+            if msg.source != "HEARTBEAT":
+                # Serialize once here so /api/status can splice it verbatim
+                web_chat_history.append(orjson.dumps(msg, default=str))
+
+            # Persist to DB with current session ID
+            # Prefer session_id from message, fallback to global state
+            current_sid = msg.session_id or getattr(api_app.state, "current_session_id", None)
+            return (level, str(text), current_sid)
+        return None
+
     async def dispatcher_loop():
         logger.info("Message Dispatcher started.")
         while True:
             try:
-                msg = await internal_bus.get()
-                
-                # 1. Send to Console (stdout)
-                if isinstance(msg, dict):
-                     level = msg.get("level", "INFO")
-                     text = msg.get("message", str(msg))
-                     
-                     timestamp = datetime.now().strftime("%H:%M:%S")
-                     color = "white"
-                     if level == "ERROR": color = "bold red"
-                     elif level == "WARNING": color = "yellow"
-                     elif level == "THOUGHT": 
-                         color = "dim cyan"
-                         # Truncate thoughts for console clarity
-                         lines = text.split('\n')
-                         first_line = lines[0] if lines else ""
-                         if len(first_line) > 100:
-                             first_line = first_line[:97] + "..."
-                         text_obj = Text(f"[{timestamp}] [{level}] {first_line}")
-                         if len(lines) > 1 or len(text) > 100:
-                              text_obj.append(" (more...)", style="dim")
-
-                     elif level == "AGENT": color = "green"
-                     elif level == "USER": color = "blue"
-                     elif level == "HEARTBEAT": color = "magenta"
-                     elif level == "TOOL": color = "bold yellow"
-                     
-                     if level != "THOUGHT": # Already created text_obj for THOUGHT
-                        text_obj = Text(f"[{timestamp}] [{level}] {text}")
-                     
-                     text_obj.stylize(color)
-                     console.print(text_obj)
-                else:
-                    console.print(str(msg))
-                
-                # 2. Store in Web Buffers & Database
-                if isinstance(msg, dict):
-                     level = msg.get("level")
-                     text = msg.get("message", str(msg))
-                     
-                     # Log all dicts nicely to log buffer
-                     web_log_buffer.append(f"[{level}] {text}")
-                     
-                     # Chat History filters
-                     if level in ("USER", "AGENT", "THOUGHT", "HEARTBEAT", "TOOL"):
-                          # Only show non-heartbeat messages in the Web UI Chat
-                          # Heartbeats are still logged to DB below
-                          if msg.get("source") != "HEARTBEAT":
-                              web_chat_history.append(msg)
-                              
-                          # Persist to DB with current session ID
-                          # Prefer session_id from message, fallback to global state
-                          msg_sid = msg.get("session_id")
-                          current_sid = msg_sid if msg_sid else getattr(api_app.state, "current_session_id", None)
-                          await audit_logger.log_chat(role=level, content=str(text), session_id=current_sid)
-                         
-                else:
-                    # Raw string
-                    web_log_buffer.append(str(msg))
-                
-                internal_bus.task_done()
+                # Drain everything already queued and hand the chat rows of one
+                # cycle to the audit logger's background flusher together.
+                batch = [await internal_bus.get()]
+                while True:
+                    try:
+                        batch.append(internal_bus.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                chat_rows = []
+                for msg in batch:
+                    try:
+                        row = dispatch_message(msg)
+                        if row:
+                            chat_rows.append(row)
+                    except Exception as e:
+                        logger.error(f"Dispatcher Error: {e}")
+                    finally:
+                        internal_bus.task_done()
+
+                if chat_rows:
+                    await audit_logger.log_chat_many(chat_rows)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -356,42 +702,38 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
                 logger.error(f"Dispatcher Error: {e}")
 
     async def brain_loop():
+        """
+        The brain's single persistent worker: takes one command at a time off
+        command_bus and processes it inline (no task per command). It is the
+        channel's only consumer, and RLMEngine/FocusManager state is shared, so
+        thinks are deliberately serialized.
+        """
         logger.info("Brain Loop started.")
+        state = api_app.state
         while True:
             try:
                 # Wait for command
                 item = await command_bus.get()
                 print(f"🧠 Brain: Received item: {item.keys() if isinstance(item, dict) else item}")
                 
+                if not isinstance(item, dict):
+                    continue
+
                 # Identify Message Source
-                user_msg = None
-                source = None
-                sender_id = None
-                platform = None
-                session_id = item.get("session_id") if isinstance(item, dict) else None
-                
-                if isinstance(item, dict):
-                    if item.get("level") == "USER":
-                         # Message from Web UI or Heartbeat
-                         user_msg = item.get("message")
-                         source = item.get("source", "WEB") # Respect source
-                    elif item.get("type") == "user_query":
-                         # Message from Pact (Discord/Telegram)
-                         event = item.get("event")
-                         if event:
-                             # Prepend User Identity
-                             sender_name = event.metadata.get("author_display") or event.metadata.get("author_name") or "User"
-                             user_msg = f"{sender_name}: {event.content}"
-                             
-                             source = "PACT"
-                             platform = event.platform
-                             sender_id = event.sender_id
-                
+                handler = _SOURCE_HANDLERS.get((item.get("level"), item.get("type")))
+                if handler is None:
+                    continue
+                user_msg, source, platform, sender_id = handler(item)
+                session_id = item.get("session_id")
+                # Resolve the reply adapter once; reused by the success and error paths
+                adapter = pact_manager.adapters.get(platform) if source == "PACT" else None
+
                 if user_msg:
+                     # User activity resets the idle timer (dream cycle, WAL checkpoint)
+                     if source in ("WEB", "PACT", "CLI"):
+                         HeartbeatManager.get_instance().touch()
+
                      # 0. Echo User Message to Internal Bus (for History/Console)
-                     # Inject Session ID from Global State if available
-                     current_sid = getattr(api_app.state, "current_session_id", None)
-                     
                      # Session Management for PACTs
                      if source == "PACT" and not session_id:
                          # Use SessionRouter to get consistent but rotatable ID
@@ -406,8 +748,8 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
                              session_id = session_router.start_new_session(context_key)
                          
                          # Ensure Session Exists in DB (metadata update)
-                         if api_app.state.audit_logger:
-                             existing = await api_app.state.audit_logger.get_session(session_id)
+                         if session_id not in known_sessions:
+                             existing = await audit_logger.get_session(session_id)
                              if not existing:
                                  # Generate Name
                                  name = f"Pact Session {session_id[:8]}"
@@ -419,28 +761,44 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
                                           name = f"#{evt.metadata.get('channel_name')}"
                                  
                                  logger.info(f"Creating new PACT session: {session_id} ({name})")
-                                 await api_app.state.audit_logger.create_session(name=name, session_id=session_id)
+                                 await audit_logger.create_session(name=name, session_id=session_id)
+                             known_sessions.add(session_id)
                      
-                     # If WEB/Other and no session, use current
+                     # If WEB/Other and no session, use the current one from global state
+                     # (read per message: the API rotates it)
                      if not session_id:
-                         session_id = current_sid
-
-                     await internal_bus.put({
-                         "level": "HEARTBEAT" if source == "HEARTBEAT" else "USER",
-                         "message": user_msg,
-                         "source": source,
-                         "session_id": session_id # Pass it along for logging
-                     })
-
-                     # Feedback to UI
-                     await internal_bus.put({
-                         "level": "THOUGHT",
-                         "message": f"Thinking on: {user_msg}",
-                         "source": "BRAIN",
-                         "session_id": session_id
-                     })
-                     
-                     logger.info(f"Thinking on: {user_msg}")
+                         session_id = getattr(state, "current_session_id", None)
+
+                     # Optimization: Lean Heartbeat Check
+                     # Runs before anything is echoed, so a skipped tick costs no
+                     # console lines, chat buffer entries or DB rows.
+                     if source == "HEARTBEAT":
+                         try:
+                             # Use raw content if available (cleaner signal), else fallback to full message
+                             check_target = item.get("heartbeat_source_content", user_msg)
+                             is_necessary = await rlm_engine.check_heartbeat_necessity(check_target)
+                             if not is_necessary:
+                                 logger.debug("Heartbeat skipped: No actionable tasks for this time.")
+                                 continue # Skip full think cycle
+                         except Exception as hb_err:
+                             logger.error(f"Heartbeat Check Failed: {hb_err}. Proceeding to think anyway.")
+
+                     await internal_bus.put(LogMsg(
+                         level="HEARTBEAT" if source == "HEARTBEAT" else "USER",
+                         message=user_msg,
+                         source=source,
+                         session_id=session_id # Pass it along for logging
+                     ))
+
+                     # Feedback to UI (the dispatcher also echoes it to the console
+                     # and log buffer, so it is not logged a second time here)
+                     await internal_bus.put(LogMsg(
+                         level="THOUGHT",
+                         message=f"Thinking on: {user_msg}",
+                         source="BRAIN",
+                         session_id=session_id
+                     ))
+
                      # Process with Engine
                      try:
                          # Extract session_id if available (from WEB) or use the one we injected
@@ -448,72 +806,52 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
                          
                          # Trigger Typing Indicator if PACT
                          if source == "PACT" and platform and sender_id:
-                             asyncio.create_task(pact_manager.trigger_typing(platform, sender_id))
+                             spawn(pact_manager.trigger_typing(platform, sender_id), name=f"pact.typing.{platform}")
 
                          # Select model tier based on source
                          model_tier = "heartbeat_model" if source == "HEARTBEAT" else "smart_model"
                          
-                         # Optimization: Lean Heartbeat Check
-                         if source == "HEARTBEAT":
-                             try:
-                                 # Use raw content if available (cleaner signal), else fallback to full message
-                                 check_target = item.get("heartbeat_source_content", user_msg)
-                                 is_necessary = await rlm_engine.check_heartbeat_necessity(check_target)
-                                 if not is_necessary:
-                                     logger.info("🛌 Heartbeat skipped: No actionable tasks for this time.")
-                                     await internal_bus.put({
-                                         "level": "HEARTBEAT",
-                                         "message": "🛌 Heartbeat skipped: No actionable tasks for this time.",
-                                         "source": "BRAIN",
-                                         "session_id": session_id
-                                     })
-                                     continue # Skip full think cycle
-                             except Exception as hb_err:
-                                 logger.error(f"Heartbeat Check Failed: {hb_err}. Proceeding to think anyway.")
-
                          response = await rlm_engine.think(user_msg, session_id=session_id, model_tier=model_tier)
                          
                          # Reply to Source
                          if source in ["WEB", "HEARTBEAT", "CLI"]: # Handle HEARTBEAT same as WEB for now logic-wise
-                              await internal_bus.put({
-                                  "level": "AGENT",
-                                  "message": response,
-                                  "source": "BRAIN",
-                                  "session_id": session_id
-                              })
+                              await internal_bus.put(LogMsg(
+                                  level="AGENT",
+                                  message=response,
+                                  source="BRAIN",
+                                  session_id=session_id
+                              ))
                          elif source == "PACT":
-                             adapter = pact_manager.adapters.get(platform)
                              if adapter and response:
                                  await adapter.send_message(sender_id, response)
                                  # Also log to internal bus for history
-                                 await internal_bus.put({
-                                     "level": "AGENT",
-                                     "message": response,
-                                     "source": "BRAIN",
-                                     "session_id": session_id
-                                 })
+                                 await internal_bus.put(LogMsg(
+                                     level="AGENT",
+                                     message=response,
+                                     source="BRAIN",
+                                     session_id=session_id
+                                 ))
                                  
                      except Exception as e:
                          logger.error(f"Brain Error: {e}")
                          error_msg = f"My mind is clouded: {e}"
                          
                          if source == "WEB":
-                             await internal_bus.put({"level": "AGENT", "message": error_msg, "source": "BRAIN"})
+                             await internal_bus.put(LogMsg(level="AGENT", message=error_msg, source="BRAIN"))
                          elif source == "PACT":
                              # Attempt to report error back to user
                              try:
-                                 adapter = pact_manager.adapters.get(platform)
                                  if adapter and sender_id:
                                      await adapter.send_message(sender_id, f"⚠️ **Error**: {e}")
                              except Exception as send_err:
                                  logger.error(f"Failed to send error to PACT: {send_err}")
                              
                              # Also log to console/web
-                             await internal_bus.put({
-                                 "level": "ERROR", 
-                                 "message": f"Error interacting with PACT ({platform}): {e}", 
-                                 "source": "BRAIN"
-                             })
+                             await internal_bus.put(LogMsg(
+                                 level="ERROR", 
+                                 message=f"Error interacting with PACT ({platform}): {e}",
+                                 source="BRAIN"
+                             ))
                      finally:
                          # Always stop typing indicator if it was a PACT
                          if source == "PACT" and platform and sender_id:
@@ -526,8 +864,8 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
                 logger.error(f"Brain Loop Critical Error: {e}")
                 await asyncio.sleep(1) # Backoff
     
-    brain_task = asyncio.create_task(brain_loop())
-    dispatcher_task = asyncio.create_task(dispatcher_loop())
+    spawn(brain_loop(), name="brain_loop")
+    spawn(dispatcher_loop(), name="dispatcher_loop")
     
     # Main Keep-Alive Loop
     shutdown_event = asyncio.Event()
@@ -543,19 +881,27 @@ async def run_daemon(tui_app: Optional[App], api_app: FastAPI) -> None:
         # 6. Graceful Shutdown
         logger.info("Shutting down AuricDaemon...")
         
-        # Stop PactManager
-        await pact_manager.stop()
+        # Stop Scheduler (don't block on in-flight jobs)
+        scheduler.shutdown(wait=False)
         
-        # Stop Scheduler
-        scheduler.shutdown()
+        # Let Uvicorn finish in-flight requests before it is cancelled
+        server.should_exit = True
+        await asyncio.wait({api_task}, timeout=API_SHUTDOWN_TIMEOUT)
+
+        # Cancel every remaining task (Brain, Dispatcher, re-indexing, typing...)
+        # and reap them alongside the PactManager
+        pending = tuple(background_tasks)
+        for task in pending:
+            task.cancel()
+        results = await asyncio.gather(pact_manager.stop(), *pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error during shutdown: {result}")
         
-        # Stop API Server
-        api_task.cancel()
-        dispatcher_task.cancel()
-        try:
-            await api_task
-            await dispatcher_task
-        except asyncio.CancelledError:
-            pass
+        # Persist any debounced session-map changes
+        session_router.flush_now()
+
+        # Release DB connections instead of leaving them to GC
+        await audit_logger.close()
             
         logger.info("Shutdown complete.")
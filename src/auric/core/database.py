@@ -1,45 +1,60 @@
 import asyncio
+import logging
+from contextlib import asynccontextmanager
 import aiofiles
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Any, Dict
+from typing import AsyncIterator, Optional, List, Any, Dict, Set, Tuple, Union
 from uuid import uuid4
 
-from pydantic import Json
-from sqlalchemy import JSON, Column, text, delete, func, desc
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-from sqlmodel import Field, SQLModel, Session, select
+from sqlalchemy import JSON, Column, Index, Row, case, event, text, delete, func, desc, insert, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 
 class TaskExecution(SQLModel, table=True):
+    __table_args__ = (
+        # get_pending_approval_task: newest PENDING_APPROVAL row is one index seek
+        Index("ix_taskexecution_pending", "started_at", sqlite_where=text("status = 'PENDING_APPROVAL'")),
+    )
+
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
     goal: str
-    status: str = Field(default="RUNNING")
-    started_at: datetime = Field(default_factory=datetime.now)
+    status: str = Field(default="RUNNING", index=True)
+    started_at: datetime = Field(default_factory=datetime.now, index=True)
     completed_at: Optional[datetime] = None
     error_log: Optional[str] = None
 
 
 class TaskStep(SQLModel, table=True):
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
-    task_id: str = Field(foreign_key="taskexecution.id")
+    task_id: str = Field(foreign_key="taskexecution.id", index=True)
     tool_name: Optional[str] = None
     tool_input: Optional[str] = None
     tool_output: Optional[str] = None
     thought_process: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=datetime.now, index=True)
 
 
 class ChatMessage(SQLModel, table=True):
+    __table_args__ = (
+        # Per-session history and the get_sessions aggregate are index range scans
+        Index("ix_chat_session_ts", "session_id", "timestamp"),
+    )
+
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
     role: str  # USER, AGENT, THOUGHT
     content: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=datetime.now, index=True)
     session_id: Optional[str] = None
 
 
-class Session(SQLModel, table=True):
+class ChatSession(SQLModel, table=True):
+    # Table name predates the class rename
+    __tablename__ = "session"
+
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
     name: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.now)
@@ -47,7 +62,7 @@ class Session(SQLModel, table=True):
 
 class LLMInteraction(SQLModel, table=True):
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=datetime.now, index=True)
     model: str
     session_id: Optional[str] = None
     input_messages: List[Any] = Field(sa_column=Column(JSON))
@@ -67,6 +82,59 @@ class Heartbeat(SQLModel, table=True):
 
 from auric.core.config import AURIC_ROOT
 
+logger = logging.getLogger("auric.core.database")
+
+# Chat messages, LLM interactions and task steps are written by a background
+# flusher: at most this many rows per commit, with producers blocking once this
+# many are waiting.
+WRITE_FLUSH_BATCH = 128
+WRITE_QUEUE_MAXSIZE = 1000
+
+# Pooled SQLite connections: the single writer plus a few concurrent readers
+DB_POOL_SIZE = 5
+
+# What callers pass to log_chat_many: (role, content, session_id)
+ChatRow = Tuple[str, str, Optional[str]]
+# Internal write-queue format: a ChatRow plus the timestamp taken when it was
+# logged (not when it is flushed)
+QueuedChatRow = Tuple[str, str, Optional[str], datetime]
+# A queued write: a chat row tuple or a ready model instance
+PendingRow = Union[QueuedChatRow, SQLModel]
+
+# Database-wide SQLite settings, persisted in the file and set once by init_db
+SQLITE_INIT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL", # Readers (dashboard polling) don't block the writer
+)
+
+# Per-connection SQLite settings; these reset with every new handle the pool opens.
+SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=1073741824", # 1 GiB of address space; only touched pages count
+    "PRAGMA cache_size=-65536", # 64 MiB page cache for ORDER BY-heavy reads
+    # Checkpoint less often during bursts; checkpoint() truncates the WAL when idle
+    "PRAGMA wal_autocheckpoint=2000",
+)
+
+# Stored in PRAGMA user_version once init_db's column migrations have run;
+# bump it when adding a migration.
+SCHEMA_VERSION = 1
+
+def _apply_connection_pragmas(dbapi_connection, connection_record) -> None:
+    """Engine "connect" hook: tunes each new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_CONNECTION_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+def _create_missing_indexes(sync_conn) -> None:
+    """Creates any declared index that an older database file lacks."""
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
 class AuditLogger:
     def __init__(self, db_path: Optional[Path] = None):
         if db_path is None:
@@ -79,68 +147,116 @@ class AuditLogger:
         
         # Create async engine
         connection_string = f"sqlite+aiosqlite:///{self.db_path}"
-        # increase timeout to prevent "database is locked"
-        self.engine = create_async_engine(connection_string, echo=False, connect_args={"timeout": 60})
+        # increase timeout to prevent "database is locked" (sqlite3 applies it
+        # as the connection's busy_timeout). Writes are serialized by _write_lock
+        # on one session; the fixed pool bounds concurrent readers.
+        self.engine = create_async_engine(
+            connection_string, echo=False, connect_args={"timeout": 60},
+            poolclass=AsyncAdaptedQueuePool, pool_size=DB_POOL_SIZE, max_overflow=0
+        )
+        event.listen(self.engine.sync_engine, "connect", _apply_connection_pragmas)
+        # Configured once; every read and the shared write session come from it.
+        # Loaded rows stay usable after commit without a refresh SELECT.
+        self._session_factory = async_sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+
+        # All writes share one session, one transaction at a time; reads use
+        # short-lived sessions so they never wait behind the writer.
+        self._write_session: Optional[AsyncSession] = None
+        self._write_lock = asyncio.Lock()
+
+        # Pending rows (see PendingRow), drained by _write_flusher
+        self._pending_writes: Optional[asyncio.Queue] = None
+        self._write_flusher_task: Optional[asyncio.Task] = None
+
+        # LLMInteraction row count: counted once, then kept current by _write_rows
+        self._llm_count: Optional[int] = None
 
     async def init_db(self):
         """Creates tables if they don't exist and handles migrations."""
         async with self.engine.begin() as conn:
+            # Database-wide PRAGMAs first, so a new file is created in WAL mode
+            # (the per-connection PRAGMAs are applied by _apply_connection_pragmas).
+            # Retrying a few times in case of transient locks
+            for pragma in SQLITE_INIT_PRAGMAS:
+                for i in range(5):
+                    try:
+                        await conn.exec_driver_sql(pragma)
+                        break
+                    except Exception as e:
+                        if "database is locked" in str(e) and i < 4:
+                            await asyncio.sleep(1)
+                        else:
+                            raise e
+
             await conn.run_sync(SQLModel.metadata.create_all)
             
             # --- Migrations ---
-            # Check for missing 'session_id' in LLMInteraction
+            # Column migrations are stamped into PRAGMA user_version once they
+            # succeed, so an up-to-date file skips them with one integer read.
             try:
-                # Get table info
-                columns_result = await conn.execute(text("PRAGMA table_info(llminteraction);"))
-                columns = [row.name for row in columns_result.fetchall()]
-                
-                if "session_id" not in columns:
-                    # Add column
-                    await conn.execute(text("ALTER TABLE llminteraction ADD COLUMN session_id VARCHAR;"))
-            except Exception as e:
-                # Ignore if table doesn't exist or other error (create_all should have handled table creation)
-                pass
+                version = (await conn.execute(text("PRAGMA user_version;"))).scalar() or 0
+            except Exception:
+                version = 0
 
-            # Check for missing 'session_id' in ChatMessage
-            try:
-                columns_result = await conn.execute(text("PRAGMA table_info(chatmessage);"))
-                columns = [row.name for row in columns_result.fetchall()]
-                
-                if "session_id" not in columns:
-                    await conn.execute(text("ALTER TABLE chatmessage ADD COLUMN session_id VARCHAR;"))
-            except Exception as e:
-                pass
-            # ------------------
+            if version < SCHEMA_VERSION:
+                migrated = True
 
-            # Enable WAL mode for better concurrency
-            # Retrying a few times in case of transient locks
-            for i in range(5):
+                # Check for missing 'session_id' in LLMInteraction
                 try:
-                    await conn.execute(text("PRAGMA journal_mode=WAL;"))
-                    await conn.execute(text("PRAGMA synchronous=NORMAL;"))
-                    break
+                    # Get table info
+                    columns_result = await conn.execute(text("PRAGMA table_info(llminteraction);"))
+                    columns = [row.name for row in columns_result.fetchall()]
+
+                    if "session_id" not in columns:
+                        # Add column
+                        await conn.execute(text("ALTER TABLE llminteraction ADD COLUMN session_id VARCHAR;"))
                 except Exception as e:
-                    if "database is locked" in str(e) and i < 4:
-                        await asyncio.sleep(1)
-                    else:
-                        raise e
+                    # Ignore if table doesn't exist or other error (create_all should have handled table creation)
+                    migrated = False
+
+                # Check for missing 'session_id' in ChatMessage
+                try:
+                    columns_result = await conn.execute(text("PRAGMA table_info(chatmessage);"))
+                    columns = [row.name for row in columns_result.fetchall()]
+
+                    if "session_id" not in columns:
+                        await conn.execute(text("ALTER TABLE chatmessage ADD COLUMN session_id VARCHAR;"))
+                except Exception as e:
+                    migrated = False
+
+                if migrated:
+                    await conn.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION};"))
+
+            # create_all skips indexes on tables that already exist
+            await conn.run_sync(_create_missing_indexes)
+            # ------------------
+
+    @asynccontextmanager
+    async def _write(self) -> AsyncIterator[AsyncSession]:
+        """Yields the shared write session inside a transaction, committed on exit."""
+        async with self._write_lock:
+            if self._write_session is None:
+                self._write_session = self._session_factory()
+            session = self._write_session
+            try:
+                async with session.begin():
+                    yield session
+            finally:
+                # Don't let the identity map serve stale rows to the next write
+                session.expunge_all()
 
     async def create_task(self, goal: str) -> str:
         """Starts a new task execution log and returns the task ID."""
         task = TaskExecution(goal=goal)
-        async with AsyncSession(self.engine) as session:
+        async with self._write() as session:
             session.add(task)
-            await session.commit()
-            await session.refresh(task)
-            return task.id
+        return task.id
 
     async def log_step(self, task_id: str, step_data: TaskStep) -> None:
-        """Appends a step to a task."""
+        """Queues a step for a task; it is committed by the background flusher."""
         # Ensure the step is linked to the correct task
         step_data.task_id = task_id
-        async with AsyncSession(self.engine) as session:
-            session.add(step_data)
-            await session.commit()
+        await self._enqueue_write(step_data)
 
     async def update_status(self, task_id: str, status: str, error_log: Optional[str] = None) -> None:
         """Updates the status of a task.
@@ -148,48 +264,128 @@ class AuditLogger:
         If status is COMPLETED or FAILED, sets completed_at.
         If status is PENDING_APPROVAL, completed_at remains None.
         """
-        async with AsyncSession(self.engine) as session:
-            statement = select(TaskExecution).where(TaskExecution.id == task_id)
-            result = await session.exec(statement)
-            task = result.one_or_none()
-            
-            if task:
-                task.status = status
-                if error_log:
-                    task.error_log = error_log
-                
-                # Update completed_at only for terminal states
-                if status in ["COMPLETED", "FAILED"]:
-                     if task.completed_at is None: # Only set if not already set
-                        task.completed_at = datetime.now()
-                
-                # Check for PENDING_APPROVAL specific logic (ensure NOT completed)
-                if status == "PENDING_APPROVAL":
-                    task.completed_at = None
+        values: Dict[str, Any] = {"status": status}
+        if error_log:
+            values["error_log"] = error_log
+
+        # Update completed_at only for terminal states (keeping an existing one)
+        if status in ["COMPLETED", "FAILED"]:
+            values["completed_at"] = func.coalesce(TaskExecution.completed_at, datetime.now())
 
-                session.add(task)
-                await session.commit()
+        # Check for PENDING_APPROVAL specific logic (ensure NOT completed)
+        if status == "PENDING_APPROVAL":
+            values["completed_at"] = None
+
+        # One UPDATE: no row load or ORM flush
+        statement = update(TaskExecution).where(TaskExecution.id == task_id).values(**values)
+        async with self._write() as session:
+            await session.exec(statement)
 
     async def get_pending_approval_task(self) -> Optional[TaskExecution]:
         """
         Retrieves the latest task that is in PENDING_APPROVAL status.
         """
-        async with AsyncSession(self.engine) as session:
+        async with self._session_factory() as session:
             # Order by started_at desc to get the most recent one
             statement = select(TaskExecution).where(TaskExecution.status == "PENDING_APPROVAL").order_by(TaskExecution.started_at.desc()).limit(1)
             result = await session.exec(statement)
             return result.one_or_none()
 
+    async def get_pending_approval_task_row(self) -> Optional[Row]:
+        """
+        Retrieves (id, status, started_at) of the latest PENDING_APPROVAL task.
+
+        Lightweight variant of get_pending_approval_task for the per-message
+        PACT check: selects three columns and skips model construction.
+        """
+        async with self._session_factory() as session:
+            statement = (
+                select(TaskExecution.id, TaskExecution.status, TaskExecution.started_at)
+                .where(TaskExecution.status == "PENDING_APPROVAL")
+                .order_by(TaskExecution.started_at.desc())
+                .limit(1)
+            )
+            result = await session.exec(statement)
+            return result.first()
+
     async def log_chat(self, role: str, content: str, session_id: Optional[str] = None) -> None:
-        """Logs a chat message."""
-        message = ChatMessage(role=role, content=content, session_id=session_id)
-        async with AsyncSession(self.engine) as session:
-            session.add(message)
-            await session.commit()
+        """Queues a chat message; it is committed by the background flusher."""
+        await self._enqueue_write((role, content, session_id, datetime.now()))
+
+    async def log_chat_many(self, rows: List[ChatRow]) -> None:
+        """Queues a batch of (role, content, session_id) chat messages."""
+        for role, content, session_id in rows:
+            await self._enqueue_write((role, content, session_id, datetime.now()))
+
+    async def _enqueue_write(self, row: PendingRow) -> None:
+        """Puts a row on the pending queue, starting the flusher on first use."""
+        if self._write_flusher_task is None or self._write_flusher_task.done():
+            if self._pending_writes is None:
+                self._pending_writes = asyncio.Queue(maxsize=WRITE_QUEUE_MAXSIZE)
+            self._write_flusher_task = asyncio.create_task(self._write_flusher(), name="audit.write_flusher")
+        # Blocks only when the flusher has fallen WRITE_QUEUE_MAXSIZE rows behind
+        await self._pending_writes.put(row)
+
+    async def _write_flusher(self) -> None:
+        """Commits queued rows, up to WRITE_FLUSH_BATCH per transaction."""
+        queue = self._pending_writes
+        while True:
+            rows = [await queue.get()]
+            while len(rows) < WRITE_FLUSH_BATCH:
+                try:
+                    rows.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._write_rows(rows)
+            except Exception as e:
+                logger.error(f"Failed to persist {len(rows)} queued rows: {e}")
+            finally:
+                for _ in rows:
+                    queue.task_done()
+
+    async def _write_rows(self, rows: List[PendingRow]) -> None:
+        """Commits queued rows with one executemany INSERT per table (no ORM unit of work)."""
+        values_by_model: Dict[type, List[Dict[str, Any]]] = {}
+        for row in rows:
+            if isinstance(row, tuple):
+                role, content, session_id, timestamp = row
+                # Core inserts skip the model's default factories
+                values = {
+                    "id": str(uuid4()), "role": role, "content": content,
+                    "timestamp": timestamp, "session_id": session_id,
+                }
+                values_by_model.setdefault(ChatMessage, []).append(values)
+            else:
+                values_by_model.setdefault(type(row), []).append(row.model_dump())
+
+        async with self._write() as session:
+            for model, values in values_by_model.items():
+                await session.exec(insert(model), params=values)
+        # No await between the commit releasing _write_lock and this update, so a
+        # COUNT(*) taken under the lock sees either both or neither
+        if self._llm_count is not None:
+            self._llm_count += len(values_by_model.get(LLMInteraction, ()))
+
+    async def flush(self) -> None:
+        """Waits until every queued chat message, LLM interaction and task step has been committed."""
+        if self._pending_writes is None:
+            return
+        if self._write_flusher_task is None or self._write_flusher_task.done():
+            # No flusher to hand off to (e.g. cancelled): write the leftovers here
+            rows = []
+            while not self._pending_writes.empty():
+                rows.append(self._pending_writes.get_nowait())
+                self._pending_writes.task_done()
+            if rows:
+                await self._write_rows(rows)
+            return
+        await self._pending_writes.join()
 
     async def get_chat_history(self, limit: int = 50, session_id: Optional[str] = None) -> List[ChatMessage]:
         """Retrieves recent chat history."""
-        async with AsyncSession(self.engine) as session:
+        await self.flush()
+        async with self._session_factory() as session:
             statement = select(ChatMessage)
             
             if session_id:
@@ -202,40 +398,49 @@ class AuditLogger:
 
     async def get_sessions(self) -> List[Dict[str, Any]]:
         """Retrieves a list of chat sessions."""
-        async with AsyncSession(self.engine) as session:
-            # 1. Get all sessions with message counts and last active time
-            statement = select(
+        await self.flush()
+        async with self._session_factory() as session:
+            # Message counts and last active time per session
+            activity = select(
                 ChatMessage.session_id,
                 func.max(ChatMessage.timestamp).label("last_active"),
                 func.count(ChatMessage.id).label("fn_count")
-            ).group_by(ChatMessage.session_id).order_by(desc("last_active"))
-            
+            ).group_by(ChatMessage.session_id).subquery()
+
+            # First message, used as the name of unnamed sessions. CASE only
+            # evaluates it for those rows (one ix_chat_session_ts seek each).
+            first_message = (
+                select(ChatMessage.content)
+                .where(ChatMessage.session_id == activity.c.session_id)
+                .order_by(ChatMessage.timestamp.asc())
+                .limit(1)
+                .scalar_subquery()
+            )
+            statement = (
+                select(
+                    activity.c.session_id,
+                    activity.c.last_active,
+                    activity.c.fn_count,
+                    ChatSession.name,
+                    case((func.coalesce(ChatSession.name, "") == "", first_message)),
+                )
+                .outerjoin(ChatSession, ChatSession.id == activity.c.session_id)
+                .order_by(desc(activity.c.last_active))
+            )
+
             result = await session.exec(statement)
             sessions_data = []
-            
-            for row in result.all():
-                sess_id, last_active, count = row
+
+            for sess_id, last_active, count, sess_name, first_content in result.all():
                 if not sess_id: continue
 
-                # 2. Get Session Name (if exists)
-                # We could join, but let's just query for now or rely on separate query if needed.
-                # Actually, let's just get the name from Session table.
-                
-                name = "Unknown Session"
-                
-                # Fetch Session object
-                sess_obj = await session.get(Session, sess_id)
-                if sess_obj and sess_obj.name:
-                    name = sess_obj.name
+                if sess_name:
+                    name = sess_name
+                elif first_content:
+                    # Truncate to 30 chars
+                    name = first_content[:30] + "..." if len(first_content) > 30 else first_content
                 else:
-                    # Generate name from first message
-                    msg_stmt = select(ChatMessage).where(ChatMessage.session_id == sess_id).order_by(ChatMessage.timestamp.asc()).limit(1)
-                    first_msg = (await session.exec(msg_stmt)).one_or_none()
-                    if first_msg:
-                        # Truncate to 30 chars
-                        name = first_msg.content[:30] + "..." if len(first_msg.content) > 30 else first_msg.content
-                    else:
-                        name = f"Session {sess_id[:8]}"
+                    name = f"Session {sess_id[:8]}"
 
                 sessions_data.append({
                     "session_id": sess_id,
@@ -247,15 +452,36 @@ class AuditLogger:
             return sessions_data
 
     async def log_llm(self, interaction: LLMInteraction) -> None:
-        """Logs an LLM interaction."""
-        async with AsyncSession(self.engine) as session:
-            session.add(interaction)
-            await session.commit()
+        """Queues an LLM interaction; it is committed by the background flusher."""
+        await self._enqueue_write(interaction)
 
     async def close(self):
-        """Disposes of the engine and connection pool."""
+        """Commits queued rows, then disposes of the engine and connection pool."""
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush queued rows on close: {e}")
+        if self._write_flusher_task is not None:
+            self._write_flusher_task.cancel()
+            try:
+                await self._write_flusher_task
+            except asyncio.CancelledError:
+                pass
+            self._write_flusher_task = None
+        if self._write_session is not None:
+            await self._write_session.close()
+            self._write_session = None
         await self.engine.dispose()
 
+    async def checkpoint(self) -> None:
+        """Copies the WAL back into the database file and truncates it (run while idle)."""
+        async with self.engine.connect() as conn:
+            busy, wal_pages, checkpointed = (
+                await conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+            ).one()
+        if busy:
+            logger.debug(f"WAL checkpoint incomplete: {checkpointed}/{wal_pages} pages (database busy).")
+
     async def __aenter__(self):
         return self
 
@@ -270,74 +496,103 @@ class AuditLogger:
             metadata_json = json.dumps(meta)
             
         hb = Heartbeat(status=status, metadata_json=metadata_json)
-        async with AsyncSession(self.engine) as session:
+        async with self._write() as session:
             session.add(hb)
-            await session.commit()
 
-    async def get_llm_logs(self, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
-        """Retrieves paginated LLM interaction logs."""
-        async with AsyncSession(self.engine) as session:
-            # Get total count
-            count_statement = select(func.count(LLMInteraction.id))
-            count_result = await session.exec(count_statement)
-            total = count_result.one()
+    async def get_llm_logs(
+        self, limit: int = 20, offset: int = 0, cursor: Optional[Tuple[datetime, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieves paginated LLM interaction logs, newest first.
+
+        Pass the previous page's ``next_cursor`` (a ``(timestamp, id)`` pair) as
+        ``cursor`` to continue after it with an index seek; ``offset`` is only
+        used without a cursor and has to skip every earlier row.
+        """
+        await self.flush()
+        async with self._session_factory() as session:
+            # Total count: one COUNT(*) per process, then the cached running total.
+            # Counted under _write_lock so a concurrent flush can't be missed or
+            # counted twice (see _write_rows)
+            if self._llm_count is None:
+                async with self._write_lock:
+                    if self._llm_count is None:
+                        count_statement = select(func.count()).select_from(LLMInteraction)
+                        self._llm_count = (await session.exec(count_statement)).one()
+            total = self._llm_count
 
             # Get items
-            statement = select(LLMInteraction).order_by(LLMInteraction.timestamp.desc()).offset(offset).limit(limit)
-            result = await session.exec(statement)
+            statement = select(LLMInteraction).order_by(
+                LLMInteraction.timestamp.desc(), LLMInteraction.id.desc()
+            )
+            if cursor is not None:
+                statement = statement.where(tuple_(LLMInteraction.timestamp, LLMInteraction.id) < cursor)
+            elif offset:
+                statement = statement.offset(offset)
+            result = await session.exec(statement.limit(limit))
             items = result.all()
 
+            next_cursor = None
+            if items and len(items) == limit:
+                next_cursor = (items[-1].timestamp, items[-1].id)
+
             return {
                 "total": total,
-                "items": items
+                "items": items,
+                "next_cursor": next_cursor
             }
             
     async def clear_chat_history(self) -> None:
         """Clears all chat history."""
-        async with AsyncSession(self.engine) as session:
+        await self.flush()
+        async with self._write() as session:
             await session.exec(delete(ChatMessage))
-            await session.commit()
 
     async def create_session(self, name: Optional[str] = None, session_id: Optional[str] = None) -> str:
         """Creates a new session and returns its ID."""
         if not session_id:
             session_id = str(uuid4())
         
-        session = Session(id=session_id, name=name)
-        async with AsyncSession(self.engine) as db:
+        session = ChatSession(id=session_id, name=name)
+        async with self._write() as db:
             # Check if exists (upsert logic or fail? let's fail if ID collision unless handled)
             # Actually for strict session management, we might want get_or_create logic externally
             # But here let's just add. SQLModel might error if PK exists.
             # Let's use merge to be safe for upserts? No, explicit create is better.
             # If provided ID exists, we probably shouldn't be calling "create". 
             # But let's check first to prevent crash.
-            existing = await db.get(Session, session_id)
+            existing = await db.get(ChatSession, session_id)
             if existing:
                  return session_id
                  
             db.add(session)
-            await db.commit()
         return session_id
 
-    async def get_session(self, session_id: str) -> Optional[Session]:
+    async def get_session(self, session_id: str) -> Optional[ChatSession]:
         """Retrieves a session by ID."""
-        async with AsyncSession(self.engine) as db:
-            return await db.get(Session, session_id)
+        async with self._session_factory() as db:
+            return await db.get(ChatSession, session_id)
+
+    async def get_session_ids(self) -> Set[str]:
+        """Retrieves the IDs of all sessions in the session table."""
+        async with self._session_factory() as db:
+            result = await db.exec(select(ChatSession.id))
+            return set(result.all())
 
     async def rename_session(self, session_id: str, new_name: str) -> None:
         """Renames a session."""
-        async with AsyncSession(self.engine) as db:
-            statement = select(Session).where(Session.id == session_id)
+        async with self._write() as db:
+            statement = select(ChatSession).where(ChatSession.id == session_id)
             results = await db.exec(statement)
             session = results.one_or_none()
             if session:
                 session.name = new_name
                 db.add(session)
-                await db.commit()
 
     async def get_last_active_session_id(self) -> Optional[str]:
         """Retrieves the ID of the most recently active session."""
-        async with AsyncSession(self.engine) as session:
+        await self.flush()
+        async with self._session_factory() as session:
             # Check ChatMessages for most recent timestamp
             statement = select(ChatMessage.session_id).order_by(ChatMessage.timestamp.desc()).limit(1)
             result = await session.exec(statement)
@@ -348,7 +603,8 @@ class AuditLogger:
         Retrieves recent session content for summarization.
         Fetches the last N messages, filters for user/agent, and formats them.
         """
-        async with AsyncSession(self.engine) as session:
+        await self.flush()
+        async with self._session_factory() as session:
             # Fetch last N messages
             statement = select(ChatMessage).where(ChatMessage.session_id == session_id).order_by(ChatMessage.timestamp.desc()).limit(limit)
             result = await session.exec(statement)
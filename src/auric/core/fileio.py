@@ -0,0 +1,22 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+
+def atomic_write_json(path: Path, data: Any) -> None:
+    """
+    Writes `data` as compact JSON next to `path`, then swaps it into place with
+    os.replace(), so readers never see a half-written file after a crash.
+    Raises on failure (the temp file is removed); callers decide how to log it.
+    The temp name is unique per call, so concurrent writers (daemon and CLI)
+    never share one; the last os.replace() wins.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{uuid4().hex}.tmp")
+    try:
+        tmp_path.write_bytes(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        os.replace(tmp_path, path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -8,10 +8,12 @@ of the "Dream Cycle" (maintenance/summarization) and "Vigil" (scheduled checks).
 import os
 import logging
 import asyncio
+import functools
+import secrets
 from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from auric.core.config import AURIC_WORKSPACE_DIR, AURIC_ROOT, load_config
 from auric.memory import chronicles
@@ -34,9 +36,7 @@ class HeartbeatManager:
 
     @classmethod
     def get_instance(cls) -> 'HeartbeatManager':
-        """Singleton accessor."""
-        if cls._instance is None:
-            cls._instance = cls()
+        """Singleton accessor (the instance is created at import, so no check-then-set race)."""
         return cls._instance
 
     def touch(self) -> None:
@@ -63,6 +63,8 @@ class HeartbeatManager:
         return self._last_active_timestamp
 
 
+HeartbeatManager._instance = HeartbeatManager()
+
 # ==============================================================================
 # Dream Cycle Logic
 # ==============================================================================
@@ -88,11 +90,14 @@ def can_dream() -> bool:
     # We can refine this path later if config changes.
     log_path = AURIC_ROOT / "logs" / "current_session.log"
     
-    if not log_path.exists():
+    # One stat() answers both "exists" and "has content"
+    try:
+        log_size = os.stat(log_path).st_size
+    except FileNotFoundError:
         logger.debug("Skipping Dream Cycle: No session log found.")
         return False
         
-    if log_path.stat().st_size == 0:
+    if log_size == 0:
         logger.debug("Skipping Dream Cycle: Session log is empty.")
         return False
         
@@ -119,28 +124,118 @@ async def run_dream_cycle_task():
         # but 'debug' is fine.
         pass
 
+async def run_wal_checkpoint_task(audit_logger: AuditLogger):
+    """
+    APScheduler task for idle housekeeping: truncates the SQLite WAL, but only
+    while the user is idle so it never competes with chat writes.
+    """
+    if not HeartbeatManager.get_instance().is_idle(threshold_minutes=30):
+        return
+    try:
+        await audit_logger.checkpoint()
+    except Exception as e:
+        logger.warning(f"Heartbeat: WAL checkpoint failed: {e}")
+
 # ==============================================================================
 # Vigil Logic
 # ==============================================================================
 
-async def run_heartbeat_task(command_bus: Optional[asyncio.Queue] = None):
+@functools.lru_cache(maxsize=8)
+def _parse_active_hours(active_window: str) -> Tuple[int, int]:
+    """
+    Parses an 'HH:MM-HH:MM' window into (start, end) minutes since midnight.
+    Cached per string, so each tick only re-parses after the config changes.
+    Raises ValueError for a malformed window.
+    """
+    start_str, end_str = active_window.split('-')
+    start_h, start_m = map(int, start_str.split(':'))
+    end_h, end_m = map(int, end_str.split(':'))
+    return start_h * 60 + start_m, end_h * 60 + end_m
+
+# Last HEARTBEAT.md read: (path, mtime_ns, size) -> (content, has_pending_tasks)
+_heartbeat_file_cache: Dict[str, Any] = {"key": None, "content": "", "has_pending": False}
+
+def _read_heartbeat_file(path: Path, st: os.stat_result) -> Tuple[str, bool]:
+    """
+    Returns HEARTBEAT.md's content and whether it lists any tasks ('- ' items).
+    The file is only re-read and re-scanned when its mtime or size changes.
+    """
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    if _heartbeat_file_cache["key"] != key:
+        content = path.read_text(encoding="utf-8")
+        _heartbeat_file_cache.update(key=key, content=content, has_pending="- " in content)
+    return _heartbeat_file_cache["content"], _heartbeat_file_cache["has_pending"]
+
+@functools.lru_cache(maxsize=4)
+def _resolved_path(path: Path) -> str:
+    """Absolute path for the prompt, resolved once per path rather than per wake-up."""
+    return str(path.resolve())
+
+class HeartbeatBackoff:
+    """
+    Adaptive heartbeat cadence: while ticks find nothing to wake the agent for
+    (outside active hours, no tasks in HEARTBEAT.md), the scheduled job's
+    interval grows by FACTOR up to max_seconds. The first tick that wakes the
+    agent restores the configured interval.
+    """
+
+    FACTOR = 1.5
+
+    def __init__(self, scheduler: Any, job_id: str, base_seconds: float, max_seconds: float):
+        self.scheduler = scheduler
+        self.job_id = job_id
+        self.base_seconds = base_seconds
+        self.max_seconds = max(max_seconds, base_seconds)
+        self.interval_seconds = base_seconds
+        self.idle_streak = 0
+
+    def record(self, woke_agent: bool) -> None:
+        """Registers a tick's outcome, rescheduling the job if its interval changes."""
+        if woke_agent:
+            self.idle_streak = 0
+            interval = self.base_seconds
+        else:
+            self.idle_streak += 1
+            interval = min(self.interval_seconds * self.FACTOR, self.max_seconds)
+
+        if interval != self.interval_seconds:
+            self.interval_seconds = interval
+            self.scheduler.reschedule_job(self.job_id, trigger="interval", seconds=int(interval))
+            logger.debug(f"Heartbeat: Interval is now {int(interval)}s (idle streak {self.idle_streak}).")
+
+async def run_heartbeat_task(
+    command_bus: Optional[asyncio.Queue] = None, backoff: Optional[HeartbeatBackoff] = None
+):
     """
     APScheduler task for 'Heartbeat' checks (formerly Vigil).
     
     Checks if active hours are valid.
     If valid and HEARTBEAT.md exists, injects a system message into the command_bus
-    to wake up the agent.
+    to wake up the agent. With a backoff, quiet ticks stretch the job's interval.
     """
+    woke_agent = await _pulse(command_bus)
+    if backoff is not None:
+        backoff.record(woke_agent)
+
+# Wake-up prompt, only formatted on ticks that find pending tasks
+HEARTBEAT_PROMPT_TEMPLATE = (
+    "🔴 **SYSTEM HEARTBEAT TRIGGERED**\n\n"
+    "The system heartbeat has activated. Please review your `HEARTBEAT.md` checklist below (located at `{heartbeat_path_str}`) and perform any pending tasks.\n\n"
+    "**IMPORTANT RULES:**\n"
+    "- If a user asks you to remind them of something, add it to `HEARTBEAT.md` — NOT to MEMORY.md, daily logs, or any other file.\n"
+    "- After completing a one-time reminder, remove it from the `One-time Reminders` section.\n"
+    "- Do NOT track heartbeat task progress in HEARTBEAT.md — use FOCUS.md for active task tracking.\n\n"
+    "```markdown\n{content}\n```"
+    "If there are no tasks that need to be completed right now, respond ONLY with a stop token (i.e. <|stop|>) and nothing else.\n"
+)
+
+async def _pulse(command_bus: Optional[asyncio.Queue]) -> bool:
+    """One heartbeat tick; returns True if the agent was woken."""
     print(f"💓 Heartbeat Triggered: {datetime.now().strftime('%H:%M:%S')}")
     logger.info("Heartbeat: Pulse triggered.")
 
     # Log persistent heartbeat
     hb = HeartbeatManager.get_instance()
-    
-    # Generate unique session ID for this specific heartbeat
-    # This prevents history pollution
-    from uuid import uuid4
-    session_id = f"heartbeat-{uuid4()}"
 
     # Check Active Hours Logic first to determine status
     status = "ALIVE"
@@ -148,35 +243,19 @@ async def run_heartbeat_task(command_bus: Optional[asyncio.Queue] = None):
     active_window = config.agents.defaults.heartbeat.active_hours
     
     # Simple active hours check 'HH:MM-HH:MM'
-    in_hours = False
     try:
-        start_str, end_str = active_window.split('-')
+        start_minutes, end_minutes = _parse_active_hours(active_window)
+    except Exception as e:
+         logger.warning(f"Heartbeat: Could not parse active hours '{active_window}': {e}. Proceeding anyway.")
+         in_hours = True # Fail open? Or closed? Let's say open for safety.
+    else:
         now = datetime.now()
         current_minutes = now.hour * 60 + now.minute
-        
-        start_h, start_m = map(int, start_str.split(':'))
-        end_h, end_m = map(int, end_str.split(':'))
-        
-        start_minutes = start_h * 60 + start_m
-        end_minutes = end_h * 60 + end_m
-        
-        start_ts = datetime.combine(now.date(), datetime.min.time()) + timedelta(minutes=start_minutes)
-        end_ts = datetime.combine(now.date(), datetime.min.time()) + timedelta(minutes=end_minutes)
-        
-        # Handle crossing midnight
         if end_minutes < start_minutes:
-            end_ts += timedelta(days=1)
-            # Logic for crossing midnight... simplified check:
-            if start_minutes <= current_minutes or current_minutes <= end_minutes:
-                in_hours = True
-            else:
-                in_hours = False
+            # Handle crossing midnight
+            in_hours = start_minutes <= current_minutes or current_minutes <= end_minutes
         else:
-             in_hours = start_minutes <= current_minutes <= end_minutes
-            
-    except Exception as e:
-         logger.warning(f"Heartbeat: Could not parse active hours '{active_window}': {e}. Proceeding anyway.")
-         in_hours = True # Fail open? Or closed? Let's say open for safety.
+            in_hours = start_minutes <= current_minutes <= end_minutes
 
     if not in_hours:
         status = "SKIPPED"
@@ -185,34 +264,33 @@ async def run_heartbeat_task(command_bus: Optional[asyncio.Queue] = None):
 
     # Always log the heartbeat attempt
     heartbeat_file = AURIC_ROOT / "HEARTBEAT.md"
+    try:
+        heartbeat_stat = os.stat(heartbeat_file)
+    except FileNotFoundError:
+        heartbeat_stat = None
     if hb.audit_logger:
         await hb.audit_logger.log_heartbeat(status=status, meta={
             "active_window": active_window, 
             "in_hours": in_hours,
-            "has_heartbeat_file": heartbeat_file.exists()
+            "has_heartbeat_file": heartbeat_stat is not None
         })
 
     if status == "SKIPPED":
-        return
+        return False
 
     # Check Heartbeat File
-    if heartbeat_file.exists():
-        content = heartbeat_file.read_text(encoding="utf-8")
-        if "- " in content:
+    if heartbeat_stat is not None:
+        content, has_pending = _read_heartbeat_file(heartbeat_file, heartbeat_stat)
+        if has_pending:
             logger.info("Heartbeat: Pending tasks detected in HEARTBEAT.md. Waking agent...")
             if command_bus:
+                # Generate unique session ID for this specific heartbeat
+                # This prevents history pollution
+                session_id = f"heartbeat-{secrets.token_hex(8)}"
+
                 # Provide absolute path to help agent find the file
-                heartbeat_path_str = str(heartbeat_file.resolve())
-                
-                prompt = (
-                    "🔴 **SYSTEM HEARTBEAT TRIGGERED**\n\n"
-                    f"The system heartbeat has activated. Please review your `HEARTBEAT.md` checklist below (located at `{heartbeat_path_str}`) and perform any pending tasks.\n\n"
-                    "**IMPORTANT RULES:**\n"
-                    "- If a user asks you to remind them of something, add it to `HEARTBEAT.md` — NOT to MEMORY.md, daily logs, or any other file.\n"
-                    "- After completing a one-time reminder, remove it from the `One-time Reminders` section.\n"
-                    "- Do NOT track heartbeat task progress in HEARTBEAT.md — use FOCUS.md for active task tracking.\n\n"
-                    f"```markdown\n{content}\n```"
-                    f"If there are no tasks that need to be completed right now, respond ONLY with a stop token (i.e. <|stop|>) and nothing else.\n"
+                prompt = HEARTBEAT_PROMPT_TEMPLATE.format(
+                    heartbeat_path_str=_resolved_path(heartbeat_file), content=content
                 )
                 try:
                     await command_bus.put({
@@ -222,6 +300,7 @@ async def run_heartbeat_task(command_bus: Optional[asyncio.Queue] = None):
                         "session_id": session_id,
                         "heartbeat_source_content": content 
                     })
+                    return True
                 except Exception as ex:
                     logger.error(f"Heartbeat Bus Error: {ex}")
             else:
@@ -230,3 +309,4 @@ async def run_heartbeat_task(command_bus: Optional[asyncio.Queue] = None):
             logger.debug("Heartbeat: No pending tasks found in HEARTBEAT.md.")
     else:
         logger.debug("Heartbeat: No HEARTBEAT.md found.")
+    return False
@@ -2,10 +2,11 @@ import json
 import logging
 import secrets
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Collection, Dict, Optional, Set, Tuple
 from datetime import datetime
 
 from auric.core.config import AURIC_ROOT
+from auric.core.fileio import atomic_write_json
 
 logger = logging.getLogger("auric.core.pairing")
 
@@ -13,16 +14,33 @@ class PairingManager:
     """
     Manages user pairing and authorization for Pacts.
     Stores credentials in .auric/credentials/
+
+    The parsed allowlist is cached per pact and only re-read when the file's
+    mtime or size changes, so reuse one instance for per-message checks.
     """
     def __init__(self):
         self.creds_dir = AURIC_ROOT / "credentials"
-        self.creds_dir.mkdir(parents=True, exist_ok=True)
+        # Created on first write; read-only checks never need it
+        self._dir_ready = False
+        # pact -> (pairing file, allow file)
+        self._path_cache: Dict[str, Tuple[Path, Path]] = {}
+        # pact -> ((allow file mtime_ns, size), allowed user ids)
+        self._allow_cache: Dict[str, Tuple[Tuple[int, int], Set[str]]] = {}
+
+    def _paths(self, pact: str) -> Tuple[Path, Path]:
+        paths = self._path_cache.get(pact)
+        if paths is None:
+            paths = self._path_cache[pact] = (
+                self.creds_dir / f"{pact}-pairing.json",
+                self.creds_dir / f"{pact}-allowFrom.json",
+            )
+        return paths
 
     def _get_pairing_file(self, pact: str) -> Path:
-        return self.creds_dir / f"{pact}-pairing.json"
+        return self._paths(pact)[0]
 
     def _get_allow_file(self, pact: str) -> Path:
-        return self.creds_dir / f"{pact}-allowFrom.json"
+        return self._paths(pact)[1]
 
     def _load_json(self, path: Path) -> Dict:
         if not path.exists():
@@ -33,24 +51,48 @@ class PairingManager:
             logger.error(f"Failed to load {path}: {e}")
             return {}
 
+    def _ensure_dir(self) -> None:
+        if not self._dir_ready:
+            self.creds_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+
     def _save_json(self, path: Path, data: Dict) -> None:
         try:
-            path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            self._ensure_dir()
+            atomic_write_json(path, data)
         except Exception as e:
             logger.error(f"Failed to save {path}: {e}")
 
-    def is_user_allowed(self, pact: str, user_id: str, config_allowed: List[str] = []) -> bool:
+    def is_user_allowed(self, pact: str, user_id: str, config_allowed: Collection[str] = ()) -> bool:
         """
         Check if a user is allowed via config OR pairing file.
+        Pass `config_allowed` as a set/frozenset to make the first check O(1).
         """
         # 1. Check legacy/static config
         if user_id in config_allowed:
             return True
         
         # 2. Check dynamic pairing file
+        return str(user_id) in self._load_allowed_ids(pact)
+
+    def _load_allowed_ids(self, pact: str) -> Set[str]:
+        """Return the pact's allowed user ids, re-parsing the file only when it changed."""
         allow_file = self._get_allow_file(pact)
-        allowed_data = self._load_json(allow_file)
-        return str(user_id) in allowed_data
+        try:
+            st = allow_file.stat()
+        except FileNotFoundError:
+            self._allow_cache.pop(pact, None)
+            return set()
+
+        # Size too, in case two writes land within the filesystem's mtime resolution
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._allow_cache.get(pact)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        allowed_ids = set(self._load_json(allow_file))
+        self._allow_cache[pact] = (signature, allowed_ids)
+        return allowed_ids
 
     def create_request(self, pact: str, user_id: str, user_name: str) -> str:
         """
@@ -67,8 +109,9 @@ class PairingManager:
             if data["user_id"] == user_id_str:
                 return code
 
-        # Generate new shortcode (6 chars, uppercase)
-        code = secrets.token_hex(3).upper() 
+        # Generate new shortcode (6 chars, uppercase).
+        # Codes must stay uppercase: approve_request looks them up by shortcode.upper()
+        code = secrets.token_hex(3).upper()
         
         pending[code] = {
             "user_id": user_id_str,
@@ -97,17 +140,11 @@ class PairingManager:
         pairing_file = self._get_pairing_file(pact)
         pending = self._load_json(pairing_file)
         
-        # Case insensitive lookup
-        target_code = None
-        for code in pending.keys():
-            if code.upper() == shortcode.upper():
-                target_code = code
-                break
-        
-        if not target_code:
+        # Case insensitive lookup: stored codes are always uppercase (see create_request)
+        request = pending.pop(shortcode.upper(), None)
+        if request is None:
             return None
             
-        request = pending.pop(target_code)
         self._save_json(pairing_file, pending)
         
         # Add to allowed
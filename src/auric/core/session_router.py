@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 from pathlib import Path
@@ -5,9 +6,14 @@ from typing import Dict, Optional, List, Set, Tuple
 from uuid import uuid4
 
 from auric.core.config import AURIC_ROOT
+from auric.core.fileio import atomic_write_json
 
 logger = logging.getLogger("auric.core.session_router")
 
+# Seconds to wait after a mutation before rewriting the file, so a burst of
+# new contexts costs one write instead of one per context
+SAVE_DEBOUNCE_SECONDS = 0.5
+
 class SessionRouter:
     """
     Manages the mapping between 'Contexts' (e.g., a Discord Channel ID, a specific User)
@@ -19,6 +25,10 @@ class SessionRouter:
     Once a context is closed, `get_active_session_id()` returns None instead of
     auto-creating a new session. Use `start_new_session()` to explicitly create
     a fresh session for a closed context.
+
+    Inside a running event loop, saves are debounced; call `flush_now()`
+    before shutdown. Without a loop (CLI commands) every mutation is saved
+    immediately.
     """
     def __init__(self, storage_path: Path = None):
         if storage_path:
@@ -28,6 +38,8 @@ class SessionRouter:
         
         self.active_sessions: Dict[str, str] = {}
         self._closed_contexts: Set[str] = set()
+        self._dirty = False
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
         self._load()
 
     def _load(self):
@@ -58,17 +70,36 @@ class SessionRouter:
             self._closed_contexts = set()
 
     def _save(self):
-        """Save active sessions to disk."""
+        """Save active sessions to disk (atomically, via a temp file)."""
         try:
             data = {
                 "active_sessions": self.active_sessions,
                 "closed_contexts": list(self._closed_contexts)
             }
-            with open(self.storage_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            atomic_write_json(self.storage_path, data)
         except Exception as e:
             logger.error(f"Failed to save active sessions: {e}")
 
+    def _mark_dirty(self):
+        """Schedule a save, coalescing mutations made within the debounce window."""
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_now()
+            return
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(SAVE_DEBOUNCE_SECONDS, self.flush_now)
+
+    def flush_now(self):
+        """Write pending changes to disk immediately, if there are any."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._dirty:
+            self._dirty = False
+            self._save()
+
     def get_active_session_id(self, context: str) -> Optional[str]:
         """
         Get the active session ID for a given context.
@@ -79,18 +110,22 @@ class SessionRouter:
         If no session exists and the context is NOT closed, creates a new one
         (first-contact auto-creation).
         """
+        # Fast path: every message on an existing session is a single lookup.
+        # Closed contexts never have an active session (close_* pops them).
+        sid = self.active_sessions.get(context)
+        if sid is not None:
+            return sid
+
         # If this context was explicitly closed, do NOT auto-create
         if context in self._closed_contexts:
             logger.info(f"Context '{context}' is closed. Returning None (caller should create new session).")
             return None
         
-        if context not in self.active_sessions:
-            new_sid = str(uuid4())
-            self.active_sessions[context] = new_sid
-            logger.info(f"Created new session {new_sid} for context '{context}'")
-            self._save()
-        
-        return self.active_sessions[context]
+        sid = str(uuid4())
+        self.active_sessions[context] = sid
+        logger.info(f"Created new session {sid} for context '{context}'")
+        self._mark_dirty()
+        return sid
 
     def start_new_session(self, context: str) -> str:
         """
@@ -110,7 +145,7 @@ class SessionRouter:
         else:
             logger.info(f"Context '{context}': Started new session {new_sid}")
             
-        self._save()
+        self._mark_dirty()
         return new_sid
 
     def close_session(self, context: str) -> Optional[str]:
@@ -127,7 +162,7 @@ class SessionRouter:
         
         if old_sid:
             self._closed_contexts.add(context)
-            self._save()
+            self._mark_dirty()
             logger.info(f"Closed session {old_sid} for context '{context}' (context now blocked)")
         else:
             logger.warning(f"No active session to close for context '{context}'")
@@ -144,11 +179,11 @@ class SessionRouter:
         closed_pairs = list(self.active_sessions.items())
         
         # Mark all contexts as closed
-        for context in self.active_sessions:
-            self._closed_contexts.add(context)
+        self._closed_contexts.update(self.active_sessions)
         
         self.active_sessions = {}
-        self._save()
+        self._dirty = True
+        self.flush_now()
         logger.info(f"Closed all {len(closed_pairs)} active sessions.")
         
         return closed_pairs
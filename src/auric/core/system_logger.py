@@ -1,11 +1,14 @@
 import logging
 import json
 import os
+import time
 from logging.handlers import RotatingFileHandler
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
+
 from auric.core.config import AuricConfig, AURIC_ROOT
 
 class SystemLogger:
@@ -20,6 +23,15 @@ class SystemLogger:
         self.logger = logging.getLogger("auric.system")
         self.logger.setLevel(logging.INFO)
         self.logger.propagate = False # Do not propagate to root logger (console)
+        # (epoch second, its isoformat) — one tuple so threads never see a torn pair
+        self._ts_cache = (0, "")
+        # Bound log methods for the levels callers pass
+        self._level_dispatch = {
+            "DEBUG": self.logger.debug,
+            "INFO": self.logger.info,
+            "WARNING": self.logger.warning,
+            "ERROR": self.logger.error,
+        }
 
         # Ensure we don't add multiple handlers if re-initialized
         if self.logger.hasHandlers():
@@ -70,6 +82,14 @@ class SystemLogger:
             cls._instance = cls(config)
         return cls._instance
 
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether events are written. Check it before building an expensive `data`
+        payload: `if system_logger.enabled: system_logger.log(...)`.
+        """
+        return self.config.agents.defaults.logging.enabled
+
     def log(self, event_type: str, data: Dict[str, Any], session_id: Optional[str] = None, level: str = "INFO"):
         """
         Logs a structured event.
@@ -80,11 +100,11 @@ class SystemLogger:
             session_id: The active session ID, if any.
             level: Log level (INFO, WARNING, ERROR).
         """
-        if not self.config.agents.defaults.logging.enabled:
+        if not self.enabled:
             return
 
         payload = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._timestamp(),
             "event": event_type,
             "session_id": session_id,
             "level": level,
@@ -100,9 +120,35 @@ class SystemLogger:
         # The simplest reliability is to dump here.
         
         # Check level
-        log_method = getattr(self.logger, level.lower(), self.logger.info)
+        log_method = self._level_dispatch.get(level)
+        if log_method is None:
+            log_method = getattr(self.logger, level.lower(), self.logger.info)
         log_method(payload)
 
+    def _timestamp(self) -> str:
+        """
+        Local ISO-8601 timestamp with microseconds, like datetime.now().isoformat().
+        The date/time part is formatted once per second and reused.
+        """
+        now = time.time()
+        sec = int(now)
+        cached_sec, cached_str = self._ts_cache
+        if sec != cached_sec:
+            cached_str = datetime.fromtimestamp(sec).isoformat()
+            self._ts_cache = (sec, cached_str)
+        return f"{cached_str}.{int((now - sec) * 1_000_000):06d}"
+
+
+def _dumps(obj: Any) -> str:
+    """orjson with stdlib json as a fallback for what it rejects (e.g. ints beyond 64 bits)."""
+    try:
+        # Datetimes go through default=str, keeping the "YYYY-MM-DD HH:MM:SS" format
+        # json.dumps wrote, rather than orjson's RFC 3339 "T" form
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+    except TypeError:
+        return json.dumps(obj, default=str)
+
 
 class JSONLFormatter(logging.Formatter):
     """
@@ -112,12 +158,12 @@ class JSONLFormatter(logging.Formatter):
     def format(self, record):
         if isinstance(record.msg, dict):
             # It's already our structured payload
-            return json.dumps(record.msg, default=str)
+            return _dumps(record.msg)
         else:
             # It's a legacy string log or something else
-            return json.dumps({
+            return _dumps({
                 "timestamp": datetime.fromtimestamp(record.created).isoformat(),
                 "event": "SYSTEM_MSG",
                 "level": record.levelname,
                 "data": {"message": str(record.msg)}
-            }, default=str)
+            })
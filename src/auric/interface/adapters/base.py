@@ -1,19 +1,38 @@
+import asyncio
+import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Callable, Optional, Dict, Any, Awaitable
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Optional
 
-from pydantic import BaseModel, Field
+logger = logging.getLogger("auric.pact")
 
-class PactEvent(BaseModel):
+# Inbound events buffered between an adapter's network handler and the message
+# callback; when full, the oldest event is dropped
+EVENT_QUEUE_MAXSIZE = 1024
+
+def start_eager_task(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """
+    Creates a task that runs inline until its first suspension (Python 3.12
+    eager start). Per-reply helpers like typing loops often finish or block on
+    I/O right away, so they skip a trip through the event loop's ready queue.
+    """
+    return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+
+@dataclass(slots=True)
+class PactEvent:
     """
     Normalized message event from any platform (Telegram, Discord, CLI).
+
+    Built once per inbound message by adapters that already hold correctly
+    typed values, so it is a plain slotted dataclass rather than a validated model.
     """
     platform: str
     sender_id: str
     content: str
     reply_to_id: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.now)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    timestamp: datetime = field(default_factory=datetime.now)
+    metadata: Dict[str, Any] = field(default_factory=dict)
     
 class BasePact(ABC):
     """
@@ -22,6 +41,8 @@ class BasePact(ABC):
     
     def __init__(self):
         self._message_handler: Optional[Callable[[PactEvent], Awaitable[None]]] = None
+        self._event_queue: Optional[asyncio.Queue] = None
+        self._consumer_task: Optional[asyncio.Task] = None
 
     @abstractmethod
     async def start(self) -> None:
@@ -64,12 +85,53 @@ class BasePact(ABC):
         """
         self._message_handler = callback
 
+    def _start_consumer(self) -> None:
+        """
+        Starts the task that feeds queued events to the callback, so `_emit`
+        returns without waiting on it. Adapters call this from `start()`.
+        """
+        if self._consumer_task is None:
+            self._event_queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAXSIZE)
+            self._consumer_task = asyncio.create_task(
+                self._consume_events(), name=f"{self.__class__.__name__}.events"
+            )
+
+    async def _stop_consumer(self) -> None:
+        """Stops the consumer task; events still queued are dropped."""
+        if self._consumer_task is not None:
+            self._consumer_task.cancel()
+            try:
+                await self._consumer_task
+            except asyncio.CancelledError:
+                pass
+            self._consumer_task = None
+            self._event_queue = None
+
+    async def _consume_events(self) -> None:
+        queue = self._event_queue
+        while True:
+            event = await queue.get()
+            if self._message_handler:
+                try:
+                    await self._message_handler(event)
+                except Exception as e:
+                    logger.error(f"Error handling {event.platform} event: {e}", exc_info=True)
+
     async def _emit(self, event: PactEvent) -> None:
         """
         Internal helper to trigger the registered callback.
+        Queued for the consumer task when it runs, otherwise awaited directly.
         """
-        if self._message_handler:
+        if not self._message_handler:
+            return
+        queue = self._event_queue
+        if queue is None:
             await self._message_handler(event)
+            return
+        if queue.full():
+            dropped = queue.get_nowait()
+            logger.warning(f"{event.platform} event queue full; dropped oldest event from {dropped.sender_id}")
+        queue.put_nowait(event)
 
     def get_tools_definition(self) -> str:
         """
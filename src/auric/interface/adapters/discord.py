@@ -1,13 +1,32 @@
 import re
 import asyncio
+import functools
 import logging
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
 
+import aiohttp
 import discord
-from auric.interface.adapters.base import BasePact, PactEvent
+from auric.interface.adapters.base import BasePact, PactEvent, start_eager_task
 
 logger = logging.getLogger("auric.pact.discord")
 
+# Channels/users resolved over the REST API are kept (LRU) up to this many each
+RESOLVED_CACHE_SIZE = 1024
+
+# HTTP connections for REST calls (sends, reactions, fetches)
+DEFAULT_CONNECTION_LIMIT = 32
+CONNECTION_LIMIT_PER_HOST = 16
+
+@functools.lru_cache(maxsize=1)
+def _load_tools_md() -> str:
+    """discord_tools.md ships with the package, so it is read once per process."""
+    tools_path = Path(__file__).parent / "discord_tools.md"
+    if tools_path.exists():
+        return tools_path.read_text(encoding="utf-8")
+    return ""
+
 class AuricDiscordClient(discord.Client):
     """
     Internal Discord Client to handle events.
@@ -15,6 +34,8 @@ class AuricDiscordClient(discord.Client):
     def __init__(self, pact: 'DiscordPact', *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.pact = pact
+        # Created on the first message; reused so its allowlist cache stays warm
+        self._pairing_mgr = None
 
     async def on_ready(self):
         logger.info(f"Discord connected as {self.user} (ID: {self.user.id})")
@@ -39,16 +60,23 @@ class AuricDiscordClient(discord.Client):
             logger.error(f"Failed to check bot loop: {e}")
             return False
 
+    async def on_guild_channel_delete(self, channel):
+        self.pact._channel_cache.pop(channel.id, None)
+
     async def on_message(self, message: discord.Message):
         # Ignore own messages
         if message.author == self.user:
             return
 
+        pact = self.pact
+        channel = message.channel
+        is_dm = isinstance(channel, discord.DMChannel)
+
         # Trigger Logic: Only respond if mentioned, replied to, named, or in DM
         should_respond = False
         
         # 1. DMs are always intentional
-        if isinstance(message.channel, discord.DMChannel):
+        if is_dm:
             should_respond = True
         
         # 2. Direct Mention
@@ -56,7 +84,7 @@ class AuricDiscordClient(discord.Client):
             should_respond = True
             
         # 3. Name Mention
-        elif re.search(rf"\b{re.escape(self.pact.agent_name)}\b", message.content, re.IGNORECASE):
+        elif re.search(rf"\b{re.escape(pact.agent_name)}\b", message.content, re.IGNORECASE):
             should_respond = True
             
         # 4. Reply to Bot
@@ -68,7 +96,7 @@ class AuricDiscordClient(discord.Client):
             else:
                 # Need to fetch
                 try:
-                    ref_msg = await message.channel.fetch_message(message.reference.message_id)
+                    ref_msg = await channel.fetch_message(message.reference.message_id)
                     if ref_msg and ref_msg.author == self.user:
                         should_respond = True
                 except:
@@ -82,20 +110,23 @@ class AuricDiscordClient(discord.Client):
         # 5. Bot Loop Prevention
         # If the sender is a bot, check if we are in a loop
         if message.author.bot:
-             if await self._is_bot_loop(message.channel, limit=self.pact.bot_loop_limit):
-                 logger.warning(f"Bot Loop Detected in {message.channel}. Stopping response to {message.author.name}.")
+             if await self._is_bot_loop(channel, limit=pact.bot_loop_limit):
+                 logger.warning(f"Bot Loop Detected in {channel}. Stopping response to {message.author.name}.")
                  return
 
 
 
         # Whitelist Checks / Pairing Authentication
-        from auric.core.pairing import PairingManager
-        pairing_mgr = PairingManager()
+        if self._pairing_mgr is None:
+            from auric.core.pairing import PairingManager
+            self._pairing_mgr = PairingManager()
+        pairing_mgr = self._pairing_mgr
         
         user_id = str(message.author.id)
+        channel_id = str(channel.id)
         
         # Check Authorization
-        if not pairing_mgr.is_user_allowed("discord", user_id, self.pact.allowed_users):
+        if message.author.id not in pact.allowed_users and not pairing_mgr.is_user_allowed("discord", user_id):
             # Log specific exclusion
             logger.warning(f"Unauthorized message from {message.author.name} ({user_id})")
             
@@ -107,16 +138,16 @@ class AuricDiscordClient(discord.Client):
             # But if they are just chatting in a channel we are in, we shouldn't interrupt unless mentioned.
             
             should_warn = False
-            if isinstance(message.channel, discord.DMChannel):
+            if is_dm:
                 should_warn = True
             elif self.user in message.mentions:
                 should_warn = True
-            elif re.search(rf"\b{re.escape(self.pact.agent_name)}\b", message.content, re.IGNORECASE):
+            elif re.search(rf"\b{re.escape(pact.agent_name)}\b", message.content, re.IGNORECASE):
                 should_warn = True
                 
             if should_warn:
                 try:
-                    await message.channel.send(
+                    await channel.send(
                         f"⛔ **Unauthorized Identity**\n"
                         f"You are not authorized to interact with me.\n"
                         f"Please ask the administrator to approve this pairing code:\n"
@@ -128,20 +159,20 @@ class AuricDiscordClient(discord.Client):
             return
 
         # Channel Whitelist (Legacy/Optional - still enforced if configured)
-        if self.pact.allowed_channels and str(message.channel.id) not in self.pact.allowed_channels:
-             if not isinstance(message.channel, discord.DMChannel):
+        if pact.allowed_channels and channel.id not in pact.allowed_channels:
+             if not is_dm:
                  # logger.debug(f"Ignored message from unauthorized channel {message.channel.id}")
                  return
 
         # 0. Command Interception (After Whitelist)
         if message.content.strip() == "/new":
              # Security Check: Must be in allowed_users (prevents random resets if bot is public)
-             if not self.pact.allowed_users or str(message.author.id) not in self.pact.allowed_users:
-                 await message.channel.send("⛔ You are not authorized to reset the session.")
+             if message.author.id not in pact.allowed_users:
+                 await channel.send("⛔ You are not authorized to reset the session.")
                  return
 
              # Trigger new session
-             await self.pact.trigger_new_session(str(message.channel.id))
+             await pact.trigger_new_session(channel_id)
              return
 
 
@@ -160,23 +191,23 @@ class AuricDiscordClient(discord.Client):
         
         # Replace Channel Mentions <#ID>
         if message.channel_mentions:
-            for channel in message.channel_mentions:
-                 clean_content = clean_content.replace(f"<#{channel.id}>", f"#{channel.name}")
+            for mentioned in message.channel_mentions:
+                 clean_content = clean_content.replace(f"<#{mentioned.id}>", f"#{mentioned.name}")
 
         # Normalize to PactEvent
         event = PactEvent(
             platform="discord",
-            sender_id=str(message.channel.id), # We reply to the channel, not the user (unless DM)
+            sender_id=channel_id, # We reply to the channel, not the user (unless DM)
             content=clean_content,
             timestamp=message.created_at,
             metadata={
-                "channel_id": str(message.channel.id),
-                "channel_name": getattr(message.channel, "name", "DM"),
+                "channel_id": channel_id,
+                "channel_name": getattr(channel, "name", "DM"),
                 "guild_name": getattr(message.guild, "name", "Direct Message") if message.guild else "Direct Message",
-                "author_id": str(message.author.id),
+                "author_id": user_id,
                 "author_name": message.author.name,
                 "author_display": message.author.display_name,
-                "is_dm": isinstance(message.channel, discord.DMChannel)
+                "is_dm": is_dm
             }
         )
         
@@ -184,21 +215,37 @@ class AuricDiscordClient(discord.Client):
              event.reply_to_id = str(message.reference.message_id)
 
         # Emit via the parent Pact
-        await self.pact._emit(event)
+        await pact._emit(event)
 
 
 class DiscordPact(BasePact):
-    def __init__(self, token: str, allowed_channels: List[str] = [], allowed_users: List[str] = [], agent_name: str = "Auric", api_port: int = 8000, bot_loop_limit: int = 4):
+    def __init__(self, token: str, allowed_channels: Optional[Iterable[str]] = None, allowed_users: Optional[Iterable[str]] = None, agent_name: str = "Auric", api_port: int = 8000, bot_loop_limit: int = 4, connection_limit: int = DEFAULT_CONNECTION_LIMIT):
         super().__init__()
         self.token = token
-        self.allowed_channels = allowed_channels
-        self.allowed_users = allowed_users
+        self.connection_limit = connection_limit
+        # Checked on every inbound message, so kept as sets of snowflake ints:
+        # message.author.id / channel.id are compared without str() conversion
+        self.allowed_channels: FrozenSet[int] = self._snowflake_set(allowed_channels, "allowed_channels")
+        self.allowed_users: FrozenSet[int] = self._snowflake_set(allowed_users, "allowed_users")
         self.agent_name = agent_name
         self.api_port = api_port
         self.bot_loop_limit = bot_loop_limit
         self.client: Optional[AuricDiscordClient] = None
         self._task: Optional[asyncio.Task] = None
         self._typing_tasks: Dict[str, asyncio.Task] = {} # target_id -> task
+        # id -> object for channels/users the client cache didn't have and we fetched
+        self._channel_cache: "OrderedDict[int, Any]" = OrderedDict()
+        self._user_cache: "OrderedDict[int, Any]" = OrderedDict()
+
+    @staticmethod
+    def _snowflake_set(ids: Optional[Iterable[str]], setting: str) -> FrozenSet[int]:
+        snowflakes = set()
+        for raw in ids or ():
+            try:
+                snowflakes.add(int(raw))
+            except (TypeError, ValueError):
+                logger.warning(f"Ignoring non-numeric Discord id in {setting}: {raw!r}")
+        return frozenset(snowflakes)
 
     async def trigger_new_session(self, target_id: str) -> None:
         """
@@ -206,7 +253,6 @@ class DiscordPact(BasePact):
         Passes the correct discord context key so the SessionRouter
         rotates the right session (not the web session).
         """
-        import aiohttp
         try:
             url = f"http://127.0.0.1:{self.api_port}/api/sessions/new"
             # Pass the correct context key: discord:<channel_id>
@@ -240,7 +286,14 @@ class DiscordPact(BasePact):
         intents.message_content = True # Critical for reading content
         intents.dm_messages = True
 
-        self.client = AuricDiscordClient(pact=self, intents=intents)
+        # Created here, on the running loop, as aiohttp requires
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=min(CONNECTION_LIMIT_PER_HOST, self.connection_limit)
+        )
+        self.client = AuricDiscordClient(pact=self, intents=intents, connector=connector)
+
+        self._start_consumer()
 
         # Start the client in a background task because client.start() is blocking
         self._task = asyncio.create_task(self._run_client())
@@ -270,9 +323,53 @@ class DiscordPact(BasePact):
                 await self._task
             except asyncio.CancelledError:
                 pass
+        await self._stop_consumer()
         self.client = None
+        self._channel_cache.clear()
+        self._user_cache.clear()
         logger.info("Discord Pact stopped.")
 
+    @staticmethod
+    def _remember(cache: "OrderedDict[int, Any]", key: int, value: Any) -> None:
+        cache[key] = value
+        if len(cache) > RESOLVED_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    async def _resolve_channel(self, c_id: int) -> Optional[Any]:
+        """
+        Returns the channel from the client cache, then our fetched-channel LRU,
+        and only then over the REST API. None if it can't be found.
+        """
+        channel = self.client.get_channel(c_id)
+        if channel:
+            return channel
+        channel = self._channel_cache.get(c_id)
+        if channel is not None:
+            self._channel_cache.move_to_end(c_id)
+            return channel
+        try:
+            channel = await self.client.fetch_channel(c_id)
+        except discord.DiscordException:
+            return None
+        self._remember(self._channel_cache, c_id, channel)
+        return channel
+
+    async def _resolve_user(self, u_id: int) -> Optional[Any]:
+        """Like _resolve_channel, for users (DM targets)."""
+        user = self.client.get_user(u_id)
+        if user:
+            return user
+        user = self._user_cache.get(u_id)
+        if user is not None:
+            self._user_cache.move_to_end(u_id)
+            return user
+        try:
+            user = await self.client.fetch_user(u_id)
+        except discord.DiscordException:
+            return None
+        self._remember(self._user_cache, u_id, user)
+        return user
+
     async def send_dm(self, user_id: str, content: str) -> None:
         """
         Send a Direct Message to a user.
@@ -290,11 +387,7 @@ class DiscordPact(BasePact):
             
             # 1. Try as Numeric ID
             if user_id.isdigit():
-                try:
-                    u_id = int(user_id)
-                    user = await self.client.fetch_user(u_id)
-                except Exception:
-                    pass
+                user = await self._resolve_user(int(user_id))
             
             # 2. Try as Username (Fallback)
             if not user:
@@ -455,14 +548,7 @@ class DiscordPact(BasePact):
             return
 
         try:
-            c_id = int(channel_id)
-            channel = self.client.get_channel(c_id)
-            # If not in cache, fetch
-            if not channel:
-                try:
-                    channel = await self.client.fetch_channel(c_id)
-                except:
-                    pass
+            channel = await self._resolve_channel(int(channel_id))
             
             if channel and hasattr(channel, 'send'):
                 for chunk in self._chunk_message(content):
@@ -478,12 +564,21 @@ class DiscordPact(BasePact):
         Kept for backward compatibility or generic routing.
         """
         # send_dm and send_channel_message already call stop_typing
-        # Try channel first
-        try:
-            await self.send_channel_message(target_id, content)
-        except:
-            # Fallback to user
-            await self.send_dm(target_id, content)
+        if self.client and target_id.isdigit():
+            t_id = int(target_id)
+            # Known channel or user: no REST call needed to pick the endpoint
+            if self.client.get_channel(t_id) or t_id in self._channel_cache:
+                await self.send_channel_message(target_id, content)
+                return
+            if self.client.get_user(t_id) or t_id in self._user_cache:
+                await self.send_dm(target_id, content)
+                return
+            if await self._resolve_channel(t_id):
+                await self.send_channel_message(target_id, content)
+                return
+
+        # User ID or username
+        await self.send_dm(target_id, content)
 
     async def add_reaction(self, channel_id: str, message_id: str, emoji: str) -> None:
         """
@@ -493,17 +588,8 @@ class DiscordPact(BasePact):
             return
             
         try:
-            c_id = int(channel_id)
             m_id = int(message_id)
-            
-            channel = self.client.get_channel(c_id)
-            if not channel:
-                # Try fetching if not in cache? 
-                # For now assume cache or fetch
-                try:
-                    channel = await self.client.fetch_channel(c_id)
-                except:
-                    pass
+            channel = await self._resolve_channel(int(channel_id))
             
             if channel:
                 message = await channel.fetch_message(m_id)
@@ -530,20 +616,10 @@ class DiscordPact(BasePact):
         async def _typing_loop(t_id_str: str):
             try:
                 t_id = int(t_id_str)
-                # Try as channel first
-                target = self.client.get_channel(t_id)
-                if not target:
-                    try:
-                        target = await self.client.fetch_channel(t_id)
-                    except:
-                        pass
-                
-                # If not channel, try user (for DM)
+                # Try as channel first, then as user (for DM)
+                target = await self._resolve_channel(t_id)
                 if not target:
-                    try:
-                        target = await self.client.fetch_user(t_id)
-                    except:
-                        pass
+                    target = await self._resolve_user(t_id)
                 
                 if target and hasattr(target, 'typing'):
                     # discord.py typing() context manager sends a typing packet 
@@ -561,7 +637,7 @@ class DiscordPact(BasePact):
                 logger.error(f"Error in typing loop for {t_id_str}: {e}")
 
         # Spawn loop
-        self._typing_tasks[target_id] = asyncio.create_task(_typing_loop(target_id))
+        self._typing_tasks[target_id] = start_eager_task(_typing_loop(target_id))
 
     async def stop_typing(self, target_id: str) -> None:
         """
@@ -582,11 +658,7 @@ class DiscordPact(BasePact):
     # ==========================
 
     def get_tools_definition(self) -> str:
-        from pathlib import Path
-        tools_path = Path(__file__).parent / "discord_tools.md"
-        if tools_path.exists():
-            return tools_path.read_text(encoding="utf-8")
-        return ""
+        return _load_tools_md()
 
     def get_tool_names(self) -> List[str]:
         return [
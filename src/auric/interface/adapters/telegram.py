@@ -1,22 +1,37 @@
 import asyncio
 import logging
-from typing import Optional
+import secrets
+from typing import Dict, Optional
 
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, ContextTypes, filters
+from telegram.constants import ChatAction
 from telegram.error import TelegramError
 
-from auric.interface.adapters.base import BasePact, PactEvent
+from auric.interface.adapters.base import BasePact, PactEvent, start_eager_task
 
 logger = logging.getLogger("auric.pact.telegram")
 
+# Bot API connections; PTB's default (1) serializes concurrent sends/typing actions
+DEFAULT_CONNECTION_POOL_SIZE = 32
+POOL_TIMEOUT_SECONDS = 10.0
+# Telegram's typing action expires after ~5 seconds
+TYPING_REFRESH_SECONDS = 4.0
+
 class TelegramPact(BasePact):
-    def __init__(self, token: str):
+    def __init__(self, token: str, webhook_url: Optional[str] = None, listen: str = "0.0.0.0", port: int = 8443, connection_pool_size: int = DEFAULT_CONNECTION_POOL_SIZE):
         super().__init__()
         self.token = token
+        self.connection_pool_size = connection_pool_size
+        self.webhook_url = webhook_url
+        self.listen = listen
+        self.port = port
         self.application: Optional[Application] = None
         self._started = False
+        # One long-lived typing task per chat, switched on/off through its gate
+        self._typing_gates: Dict[str, asyncio.Event] = {} # chat_id -> gate
         self._typing_tasks: Dict[str, asyncio.Task] = {} # chat_id -> task
+        self._typing_wakeups: Dict[str, asyncio.Event] = {} # chat_id -> set on any gate change
 
     async def start(self) -> None:
         """
@@ -28,28 +43,53 @@ class TelegramPact(BasePact):
         logger.info("Initializing Telegram Pact...")
         
         # Build the application
-        builder = Application.builder().token(self.token)
+        builder = (
+            Application.builder()
+            .token(self.token)
+            .connection_pool_size(self.connection_pool_size)
+            .pool_timeout(POOL_TIMEOUT_SECONDS)
+        )
         self.application = builder.build()
 
         # Register handlers
         # We want to capture text messages. 
         # filters.TEXT & ~filters.COMMAND captures non-command text.
         # We might want commands too, but usually an agent just listens to chat. 
-        # Let's catch everything that is text.
-        text_handler = MessageHandler(filters.TEXT, self._telegram_handle_message)
+        # Let's catch everything that is text, in new messages only: PTB then
+        # drops edits/channel posts before they reach our handler.
+        text_handler = MessageHandler(
+            filters.UpdateType.MESSAGE & filters.TEXT, self._telegram_handle_message
+        )
         self.application.add_handler(text_handler)
 
+        self._start_consumer()
+
         # Initialize and Start
         await self.application.initialize()
         await self.application.start()
         
-        # Start Polling (non-blocking way for existing loop)
-        # We use start_polling() but we need to manage the updater's lifecycle carefully 
-        # if we are in a shared loop. 
-        # application.updater.start_polling() is asynchronous but returns a coroutine?
-        # Actually in v20+, start_polling() starts the background task.
-        
-        await self.application.updater.start_polling(drop_pending_updates=False) # type: ignore
+        # Only message updates are handled, so ask Telegram for nothing else
+        allowed_updates = [Update.MESSAGE]
+
+        if self.webhook_url:
+            # Telegram pushes updates to us; the secret token lets PTB reject
+            # requests that didn't come from Telegram
+            await self.application.updater.start_webhook( # type: ignore
+                listen=self.listen,
+                port=self.port,
+                webhook_url=self.webhook_url,
+                secret_token=secrets.token_urlsafe(32),
+                allowed_updates=allowed_updates,
+                drop_pending_updates=False
+            )
+            logger.info(f"Telegram webhook listening on {self.listen}:{self.port}")
+        else:
+            # Start Polling (non-blocking way for existing loop)
+            # In v20+, start_polling() starts the background task.
+            await self.application.updater.start_polling( # type: ignore
+                allowed_updates=allowed_updates,
+                drop_pending_updates=False
+            )
         
         self._started = True
         logger.info("Telegram Pact started.")
@@ -62,9 +102,18 @@ class TelegramPact(BasePact):
             return
 
         logger.info("Stopping Telegram Pact...")
+        typing_tasks = tuple(self._typing_tasks.values())
+        for task in typing_tasks:
+            task.cancel()
+        await asyncio.gather(*typing_tasks, return_exceptions=True)
+        self._typing_tasks.clear()
+        self._typing_gates.clear()
+        self._typing_wakeups.clear()
+
         await self.application.updater.stop() # type: ignore
         await self.application.stop()
         await self.application.shutdown()
+        await self._stop_consumer()
         self._started = False
         logger.info("Telegram Pact stopped.")
 
@@ -91,46 +140,52 @@ class TelegramPact(BasePact):
         if not self._started or not self.application:
             return
 
-        # If already typing for this target, don't spawn another task
-        if target_id in self._typing_tasks and not self._typing_tasks[target_id].done():
-            return
-
-        async def _typing_loop(chat_id: str):
-            from telegram.constants import ChatAction
-            try:
-                while True:
-                    # Telegram typing action expires after ~5 seconds
+        gate = self._typing_gates.get(target_id)
+        if gate is None:
+            gate = self._typing_gates[target_id] = asyncio.Event()
+            wakeup = self._typing_wakeups[target_id] = asyncio.Event()
+            gate.set()
+            self._typing_tasks[target_id] = start_eager_task(self._typing_loop(target_id, gate, wakeup))
+        else:
+            gate.set()
+            self._typing_wakeups[target_id].set()
+
+    async def _typing_loop(self, chat_id: str, gate: asyncio.Event, wakeup: asyncio.Event) -> None:
+        """
+        Sends the typing action every few seconds while the chat's gate is set.
+        Runs until the pact stops, so replies don't create and cancel a task each.
+        """
+        try:
+            while True:
+                await gate.wait()
+                wakeup.clear()
+                try:
                     await self.application.bot.send_chat_action(chat_id=chat_id, action=ChatAction.TYPING)
-                    await asyncio.sleep(4)
-            except asyncio.CancelledError:
-                pass
-            except Exception as e:
-                logger.error(f"Error in Telegram typing loop for {chat_id}: {e}")
-
-        # Spawn loop
-        self._typing_tasks[target_id] = asyncio.create_task(_typing_loop(target_id))
+                except Exception as e:
+                    # Keep the loop alive: its gate would otherwise never act again
+                    logger.error(f"Error in Telegram typing loop for {chat_id}: {e}")
+                # Refresh before the action expires, but wake early on stop/trigger
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=TYPING_REFRESH_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            pass
 
     async def stop_typing(self, target_id: str) -> None:
         """
         Stop the persistent typing indicator for a target.
         """
-        if target_id in self._typing_tasks:
-            task = self._typing_tasks[target_id]
-            if not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
-            del self._typing_tasks[target_id]
+        gate = self._typing_gates.get(target_id)
+        if gate is not None:
+            gate.clear()
+            self._typing_wakeups[target_id].set()
 
     async def _telegram_handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """
         Internal handler for Telegram updates.
         """
-        if not update.message or not update.message.text:
-            return
-
+        # The handler's filters guarantee update.message with text
         # Normalize to PactEvent
         user = update.message.from_user
         
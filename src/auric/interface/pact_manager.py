@@ -28,7 +28,12 @@ class PactManager:
         """
         # Telegram
         if self.config.pacts.telegram.enabled and self.config.pacts.telegram.token:
-            telegram = TelegramPact(token=self.config.pacts.telegram.token)
+            telegram = TelegramPact(
+                token=self.config.pacts.telegram.token,
+                webhook_url=self.config.pacts.telegram.webhook_url,
+                listen=self.config.pacts.telegram.webhook_listen,
+                port=self.config.pacts.telegram.webhook_port
+            )
             telegram.on_message(self.handle_message)
             self.adapters["telegram"] = telegram
             await telegram.start()
@@ -65,7 +70,8 @@ class PactManager:
         logger.info(f"Incoming PactEvent from {event.platform}: {event.content[:50]}")
 
         # 1. Check for Resume Logic (HITL)
-        pending_task = await self.audit.get_pending_approval_task()
+        # Row of (id, status, started_at); only the id is needed here
+        pending_task = await self.audit.get_pending_approval_task_row()
         
         if pending_task:
             if self._is_approval(event.content):
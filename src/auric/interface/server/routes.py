@@ -2,12 +2,14 @@
 API Routes for the Arcane Library (Web Dashboard).
 """
 import asyncio
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from datetime import datetime
 from pathlib import Path
 from uuid import uuid4
 
 from fastapi import APIRouter, Request, HTTPException, Depends
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+import orjson
 from auric.core.config import AURIC_WORKSPACE_DIR, AURIC_ROOT
 from pydantic import BaseModel
 from auric.interface.server.auth import verify_token
@@ -38,6 +40,7 @@ class SessionSummary(BaseModel):
 class LLMLogsResponse(BaseModel):
     items: List[Dict[str, Any]]
     total: int
+    next_cursor: Optional[str] = None # Pass back as ?cursor= for the next page
 
 class RenameRequest(BaseModel):
     name: str
@@ -46,6 +49,13 @@ class NewSessionRequest(BaseModel):
     context: str = "web" # "web" or "global" or specific context like "discord:123"
 
 
+# --- Helpers ---
+
+def _json_array(buffer) -> orjson.Fragment:
+    """Splices a buffer of pre-serialized JSON values into one JSON array, without re-encoding."""
+    return orjson.Fragment(b"[" + b",".join(buffer.snapshot()) + b"]")
+
+
 # --- Routes ---
 
 @router.get("/api/status", response_model=StatusResponse)
@@ -72,7 +82,9 @@ async def get_status(request: Request):
 
     # 2. Get Logs & Chat History
     # We use the buffers injected by the daemon
-    logs = list(getattr(request.app.state, "web_log_buffer", ["System initialized."]))
+    # Both buffers hold pre-serialized JSON, encoded once by the daemon's dispatcher
+    log_buffer = getattr(request.app.state, "web_log_buffer", None)
+    logs = _json_array(log_buffer) if log_buffer is not None else ["System initialized."]
     
     # Try to get persistent history from DB
     audit_logger = getattr(request.app.state, "audit_logger", None)
@@ -95,8 +107,10 @@ async def get_status(request: Request):
             chat_history.append({"level": "ERROR", "message": f"Failed to load history: {e}"})
     
     if not chat_history:
-        # Fallback to memory if DB empty or unavailable
-        chat_history = list(getattr(request.app.state, "web_chat_history", []))
+        # Fallback to memory if DB empty or unavailable.
+        chat_buffer = getattr(request.app.state, "web_chat_history", None)
+        if chat_buffer:
+            chat_history = _json_array(chat_buffer)
 
     # 3. Get Stats
     config = getattr(request.app.state, "config", None)
@@ -112,13 +126,15 @@ async def get_status(request: Request):
         "memory_usage": "N/A"
     }
 
-    return StatusResponse(
-        focus_state=focus_data,
-        logs=logs,
-        chat_history=chat_history,
-        stats=stats,
-        current_session_id=getattr(request.app.state, "current_session_id", None)
-    )
+    # Serialized directly (shape matches StatusResponse) to avoid re-encoding the buffers
+    payload = {
+        "focus_state": focus_data,
+        "logs": logs,
+        "chat_history": chat_history,
+        "stats": stats,
+        "current_session_id": current_sid
+    }
+    return Response(content=orjson.dumps(payload, default=str), media_type="application/json")
 
 @router.get("/api/sessions")
 async def get_sessions(request: Request):
@@ -401,18 +417,29 @@ async def get_system_logs(request: Request, limit: int = 100):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/api/llm_logs", response_model=LLMLogsResponse)
-async def get_llm_logs(request: Request, limit: int = 20, offset: int = 0):
-    """Returns paginated LLM logs."""
+async def get_llm_logs(request: Request, limit: int = 20, offset: int = 0, cursor: Optional[str] = None):
+    """Returns paginated LLM logs (by ?cursor= from the previous page, or ?offset=)."""
     audit_logger = getattr(request.app.state, "audit_logger", None)
     if not audit_logger:
         return {"items": [], "total": 0}
+
+    # Cursor format: "<ISO timestamp>|<interaction id>"
+    position = None
+    if cursor:
+        timestamp, _, interaction_id = cursor.partition("|")
+        try:
+            position = (datetime.fromisoformat(timestamp), interaction_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
     
     try:
-        result = await audit_logger.get_llm_logs(limit, offset)
+        result = await audit_logger.get_llm_logs(limit, offset, cursor=position)
+        next_cursor = result.get("next_cursor")
         # items are SQLModel objects, convert to dicts for safety/compatibility
         return {
             "total": result["total"],
-            "items": [item.model_dump() for item in result["items"]]
+            "items": [item.model_dump() for item in result["items"]],
+            "next_cursor": f"{next_cursor[0].isoformat()}|{next_cursor[1]}" if next_cursor else None
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,50 @@
+"""
+Static file serving for the Arcane Library (Web Dashboard).
+"""
+import hashlib
+from typing import Dict, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+# Larger files are streamed from disk by StaticFiles as usual
+MAX_CACHED_FILE_SIZE = 1024 * 1024
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that keeps small assets in memory after their first request.
+
+    Dashboard assets only change when OpenAuric is upgraded (which restarts the
+    daemon), so each file is read and hashed once. Later GETs are a dict lookup,
+    answered with 304 Not Modified while the browser's ETag still matches.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # path -> (content, etag, media_type)
+        self._cache: Dict[str, Tuple[bytes, str, str]] = {}
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] != "GET":
+            return await super().get_response(path, scope)
+
+        cached = self._cache.get(path)
+        if cached is None:
+            response = await super().get_response(path, scope)
+            if not isinstance(response, FileResponse) or response.status_code != 200:
+                return response
+            if response.stat_result is None or response.stat_result.st_size > MAX_CACHED_FILE_SIZE:
+                return response
+            content = await anyio.Path(response.path).read_bytes()
+            etag = f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+            cached = self._cache[path] = (content, etag, response.media_type)
+
+        content, etag, media_type = cached
+        # no-cache: browsers may keep the file but must revalidate (a cheap 304)
+        headers = {"etag": etag, "cache-control": "no-cache"}
+        if Headers(scope=scope).get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content, media_type=media_type, headers=headers)
@@ -417,7 +417,9 @@ class ToolRegistry:
                 
                 # LOGGING
                 from auric.core.system_logger import SystemLogger
-                SystemLogger.get_instance().log("TOOL_EXECUTION", {"name": name, "args": arguments, "result": str(result)[:1000]})
+                system_logger = SystemLogger.get_instance()
+                if system_logger.enabled:
+                    system_logger.log("TOOL_EXECUTION", {"name": name, "args": arguments, "result": str(result)[:1000]})
                 
                 return str(result)
             except TypeError as e:
@@ -430,7 +432,9 @@ class ToolRegistry:
         if name in self._spells:
             res = await self._execute_spell(name, arguments)
             from auric.core.system_logger import SystemLogger
-            SystemLogger.get_instance().log("SPELL_EXECUTION", {"name": name, "args": arguments, "result": str(res)[:1000]})
+            system_logger = SystemLogger.get_instance()
+            if system_logger.enabled:
+                system_logger.log("SPELL_EXECUTION", {"name": name, "args": arguments, "result": str(res)[:1000]})
             return res
         
         return f"Error: Tool or Spell '{name}' not found."
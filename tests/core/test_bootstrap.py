@@ -28,8 +28,9 @@ def mock_paths(tmp_path):
     # Patch the constants used in bootstrap.py
     with patch("auric.core.bootstrap.AURIC_ROOT", auric_root), \
          patch("auric.core.bootstrap.AURIC_TEMPLATES_DIR", templates_dir), \
-         patch("auric.core.bootstrap.DEFAULT_SPELLS_DIR", default_spells):
-        yield {"root": auric_root, "templates": templates_dir, "spells": default_spells}
+         patch("auric.core.bootstrap.DEFAULT_SPELLS_DIR", default_spells), \
+         patch("auric.core.bootstrap.STATIC_DIR", tmp_path / "static"):
+        yield {"root": auric_root, "templates": templates_dir, "spells": default_spells, "static": tmp_path / "static"}
 
 
 def test_ensure_workspace_success(mock_paths, caplog):
@@ -60,6 +61,14 @@ def test_ensure_workspace_success(mock_paths, caplog):
     assert f"Creating auric root at {root}" in caplog.text
 
 
+def test_ensure_workspace_creates_static_dir(mock_paths, caplog):
+    """Test the Web UI static directory is created when missing."""
+    assert not mock_paths["static"].exists()
+    bootstrap.ensure_workspace()
+    assert mock_paths["static"].is_dir()
+    assert "Static path" in caplog.text
+
+
 def test_ensure_workspace_already_exists(mock_paths, caplog):
     """Test behavior when the workspace already exists."""
     caplog.set_level(logging.INFO)
@@ -3,6 +3,7 @@ import logging
 import os
 from unittest.mock import patch, MagicMock, AsyncMock
 
+import orjson
 import pytest
 from textual.app import App
 from fastapi import FastAPI
@@ -50,8 +51,11 @@ def mock_dependencies(mock_config):
         audit_logger.init_db = AsyncMock()
         audit_logger.get_last_active_session_id = AsyncMock(return_value="last_session_123")
         audit_logger.log_chat = AsyncMock()
+        audit_logger.log_chat_many = AsyncMock()
         audit_logger.get_session = AsyncMock(return_value=None)
+        audit_logger.get_session_ids = AsyncMock(return_value=set())
         audit_logger.create_session = AsyncMock()
+        audit_logger.close = AsyncMock()
 
         # Setup mock scheduler
         scheduler = MockScheduler.return_value
@@ -79,7 +83,8 @@ def mock_dependencies(mock_config):
             "session_router": MockSessionRouter.return_value,
             "MockSessionRouter": MockSessionRouter,
             "rlm_engine": rlm_engine,
-            "MockRLMEngine": MockRLMEngine
+            "MockRLMEngine": MockRLMEngine,
+            "MockHeartbeatManager": MockHeartbeatManager
         }
 
 @pytest.mark.asyncio
@@ -96,9 +101,19 @@ async def test_run_daemon_initialization(mock_dependencies, mock_api_app):
     assert hasattr(mock_api_app.state, "web_chat_history")
     
     mock_dependencies["audit_logger"].init_db.assert_awaited_once()
+    # Heartbeats are recorded through the shared HeartbeatManager
+    heartbeat_manager = mock_dependencies["MockHeartbeatManager"].get_instance.return_value
+    assert heartbeat_manager.audit_logger is mock_dependencies["audit_logger"]
     mock_dependencies["pact_manager"].start.assert_awaited_once()
     mock_dependencies["scheduler"].start.assert_called_once()
     
+    # Shutdown reaps everything and releases the DB
+    mock_dependencies["pact_manager"].stop.assert_awaited_once()
+    mock_dependencies["scheduler"].shutdown.assert_called_once_with(wait=False)
+    mock_dependencies["audit_logger"].close.assert_awaited_once()
+    daemon_tasks = {"uvicorn.serve", "librarian.reindex", "brain_loop", "dispatcher_loop"}
+    assert not [t for t in asyncio.all_tasks() if t.get_name() in daemon_tasks]
+    
     # Check that uvicorn serve task was started (we cancel too fast so it might not be awaited here,
     # but the task was created.
     # We can check if it scheduled the dream cycle
@@ -131,6 +146,15 @@ async def test_endpoint_filter():
     rec_fail2 = logging.LogRecord("name", logging.INFO, "path", 1, "GET /api/sessions", None, None)
     assert f.filter(rec_fail2) is False
 
+    # Uvicorn access records: the path is checked without formatting the message
+    access_fmt = '%s - "%s %s HTTP/%s" %d'
+    rec_args_fail = logging.LogRecord("uvicorn.access", logging.INFO, "path", 1, access_fmt,
+                                      ("127.0.0.1:5000", "GET", "/api/status?t=1", "1.1", 200), None)
+    assert f.filter(rec_args_fail) is False
+    rec_args_pass = logging.LogRecord("uvicorn.access", logging.INFO, "path", 1, access_fmt,
+                                      ("127.0.0.1:5000", "POST", "/api/chat", "1.1", 200), None)
+    assert f.filter(rec_args_pass) is True
+
 @pytest.mark.asyncio
 async def test_run_daemon_heartbeat_intervals(mock_dependencies, mock_api_app, mock_config):
     """Test parsing of heartbeat intervals 'h', 's' and invalid strings."""
@@ -157,13 +181,68 @@ async def test_run_daemon_heartbeat_intervals(mock_dependencies, mock_api_app, m
             mock_dependencies["scheduler"].add_job.reset_mock()
 
 @pytest.mark.asyncio
-async def test_run_daemon_missing_static_dir(mock_dependencies, mock_api_app):
-    """Test creating static dir when missing."""
+async def test_run_daemon_schedules_wal_checkpoint(mock_dependencies, mock_api_app):
+    with patch("auric.core.daemon.asyncio.Event.wait", side_effect=asyncio.CancelledError):
+        await daemon.run_daemon(None, mock_api_app)
+
+    call = next(c for c in mock_dependencies["scheduler"].add_job.call_args_list if c.kwargs.get("id") == "wal_checkpoint")
+    assert call.args[0].__name__ == "run_wal_checkpoint_task"
+    assert call.args[1] == "interval"
+    assert call.kwargs["args"] == [mock_dependencies["audit_logger"]]
+    assert call.kwargs["minutes"] == daemon.WAL_CHECKPOINT_INTERVAL_MINUTES
+
+@pytest.mark.asyncio
+async def test_user_message_defers_wal_checkpoint(mock_dependencies, mock_api_app):
+    """Test a user message through brain_loop resets the idle timer the WAL checkpoint checks."""
+    from datetime import datetime, timedelta
+    from auric.core.heartbeat import HeartbeatManager, run_wal_checkpoint_task
+
+    hb = HeartbeatManager()
+    hb._last_active_timestamp = datetime.now() - timedelta(hours=1)
+    mock_dependencies["MockHeartbeatManager"].get_instance.return_value = hb
+    audit_logger = mock_dependencies["audit_logger"]
+    audit_logger.checkpoint = AsyncMock()
+
+    # Idle: the checkpoint runs
+    await run_wal_checkpoint_task(audit_logger)
+    audit_logger.checkpoint.assert_awaited_once()
+
+    async def send_message():
+        await mock_api_app.state.command_bus.put(
+            {"level": "USER", "message": "hello", "source": "WEB", "session_id": "s1"}
+        )
+        await asyncio.sleep(0.05)
+        raise asyncio.CancelledError()
+
+    with patch("auric.core.daemon.asyncio.Event.wait", side_effect=send_message):
+        await daemon.run_daemon(None, mock_api_app)
+
+    # Active again: the next checkpoint tick is skipped
+    assert not hb.is_idle(threshold_minutes=30)
+    await run_wal_checkpoint_task(audit_logger)
+    audit_logger.checkpoint.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_run_daemon_adaptive_heartbeat(mock_dependencies, mock_api_app, mock_config):
+    mock_config.agents.defaults.heartbeat.interval = "10m"
+    mock_config.agents.defaults.heartbeat.adaptive = True
+    mock_config.agents.defaults.heartbeat.max_interval = "1h"
+    with patch("auric.core.daemon.asyncio.Event.wait", side_effect=asyncio.CancelledError):
+        await daemon.run_daemon(None, mock_api_app)
+
+    call = next(c for c in mock_dependencies["scheduler"].add_job.call_args_list if c.kwargs.get("id") == "heartbeat")
+    backoff = call.kwargs["kwargs"]["backoff"]
+    assert backoff.scheduler is mock_dependencies["scheduler"]
+    assert (backoff.base_seconds, backoff.max_seconds) == (600, 3600)
+
+@pytest.mark.asyncio
+async def test_run_daemon_static_dir_not_checked(mock_dependencies, mock_api_app):
+    """Test the daemon mounts static files without touching the filesystem (bootstrap owns it)."""
     with patch("auric.core.daemon.Path.exists", return_value=False), \
          patch("auric.core.daemon.Path.mkdir") as mock_mkdir, \
          patch("auric.core.daemon.asyncio.Event.wait", side_effect=asyncio.CancelledError):
          await daemon.run_daemon(None, mock_api_app)
-         mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+         mock_mkdir.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_run_daemon_no_last_session(mock_dependencies, mock_api_app):
@@ -343,6 +422,11 @@ async def test_run_daemon_message_loops(mock_dependencies, mock_api_app, capsys)
          
     # Check that brain_loop dispatched internal bus logs correctly
     assert len(mock_api_app.state.web_log_buffer) > 0
+    # Chat rows are persisted in batches
+    assert mock_dependencies["audit_logger"].log_chat_many.await_count > 0
+    # Chat history and logs are buffered as pre-serialized JSON
+    assert all(isinstance(entry, bytes) for entry in mock_api_app.state.web_chat_history)
+    assert all(isinstance(orjson.loads(entry), str) for entry in mock_api_app.state.web_log_buffer)
     
     # Check that RLM engine received the web message to think about
 @pytest.mark.asyncio
@@ -441,7 +525,8 @@ async def test_dispatcher_exception(mock_dependencies, mock_api_app):
             raise Exception("loop crash")
         raise asyncio.CancelledError()
 
-    with patch("auric.core.daemon.asyncio.Queue.get", side_effect=mock_queue_get):
+    with patch("auric.core.daemon.asyncio.Queue.get", side_effect=mock_queue_get), \
+         patch("auric.core.daemon.FastChannel.get", side_effect=mock_queue_get, autospec=True):
          with patch("auric.core.daemon.asyncio.Event.wait", side_effect=asyncio.CancelledError):
              await daemon.run_daemon(None, mock_api_app)
 
@@ -474,3 +559,190 @@ async def test_loop_exceptions(mock_dependencies, mock_api_app, capsys):
 
 
 
+def test_source_handlers_classification():
+    """Test the brain_loop handler table classifies WEB and PACT items."""
+    web_item = {"level": "USER", "message": "hello", "source": "CLI"}
+    handler = daemon._SOURCE_HANDLERS[(web_item.get("level"), web_item.get("type"))]
+    assert handler(web_item) == ("hello", "CLI", None, None)
+
+    event = MagicMock()
+    event.platform = "discord"
+    event.sender_id = "42"
+    event.content = "ping"
+    event.metadata = {"author_name": "Alice"}
+    pact_item = {"type": "user_query", "event": event}
+    handler = daemon._SOURCE_HANDLERS[(pact_item.get("level"), pact_item.get("type"))]
+    assert handler(pact_item) == ("Alice: ping", "PACT", "discord", "42")
+
+    assert daemon._SOURCE_HANDLERS.get((None, "resume_signal")) is None
+
+def test_console_writer_thread():
+    """Test console output is printed from the writer thread."""
+    import time
+    with patch.object(daemon, "console") as mock_console, \
+         patch.object(daemon, "_STDOUT_IS_TTY", True):
+        daemon._start_console_writer()
+        daemon._console_queue.put_nowait("line one")
+        daemon._console_queue.put_nowait("line two")
+        for _ in range(100):
+            if mock_console.print.call_count >= 2:
+                break
+            time.sleep(0.01)
+    printed = [c.args[0] for c in mock_console.print.call_args_list]
+    assert "line one" in printed and "line two" in printed
+    assert daemon._console_thread.daemon is True
+
+def test_console_writer_plain_when_not_tty():
+    """Test non-TTY output bypasses Rich and is written as encoded lines."""
+    import io
+    import time
+    raw = io.BytesIO()
+    out = io.TextIOWrapper(raw, encoding="utf-8")
+    with patch.object(daemon, "console") as mock_console, \
+         patch.object(daemon, "_STDOUT_IS_TTY", False), \
+         patch.object(daemon.sys, "stdout", out):
+        daemon._start_console_writer()
+        daemon._console_queue.put_nowait(daemon._plain_line("12:00:00", "AGENT", "plain ✨"))
+        for _ in range(100):
+            if b"plain" in raw.getvalue():
+                break
+            time.sleep(0.01)
+    assert "[12:00:00] [AGENT] plain ✨\n".encode() in raw.getvalue()
+    mock_console.print.assert_not_called()
+
+def test_plain_line_formatting():
+    """Test the encoded console line builder."""
+    assert daemon._plain_line("09:15:00", "THOUGHT", "hmm", more=True) == b"[09:15:00] [THOUGHT] hmm (more...)\n"
+    assert daemon._LEVEL_PREFIXES["THOUGHT"] == b"] [THOUGHT] "
+
+@pytest.mark.asyncio
+async def test_run_daemon_multiple_workers_warns(mock_dependencies, mock_api_app, mock_config, caplog):
+    """Test that gateway.workers > 1 falls back to the single in-process server."""
+    mock_config.gateway.workers = 4
+    with patch("auric.core.daemon.asyncio.Event.wait", side_effect=asyncio.CancelledError):
+        await daemon.run_daemon(None, mock_api_app)
+    assert "gateway.workers=4 is not supported" in caplog.text
+
+@pytest.mark.asyncio
+async def test_fast_channel_fifo_and_wakeup():
+    """Test the command bus channel preserves order and wakes a parked consumer."""
+    channel = daemon.FastChannel()
+    assert channel.empty()
+
+    getter = asyncio.create_task(channel.get())
+    await asyncio.sleep(0)
+    await channel.put("first")
+    channel.put_nowait("second")
+
+    assert await asyncio.wait_for(getter, timeout=1) == "first"
+    assert channel.qsize() == 1
+    assert await channel.get() == "second"
+    assert channel.empty()
+
+def test_log_msg_from_dict_and_serialization():
+    """Test legacy dict messages convert to LogMsg and serialize like the old dicts."""
+    msg = daemon.LogMsg.from_dict({"level": "AGENT", "message": "hi", "session_id": "s1"})
+    assert msg == daemon.LogMsg(level="AGENT", message="hi", source="BRAIN", session_id="s1")
+    assert daemon.LogMsg.from_dict({}).level == "INFO"
+    assert orjson.loads(orjson.dumps(msg)) == {
+        "level": "AGENT", "message": "hi", "source": "BRAIN", "session_id": "s1"
+    }
+    with pytest.raises(AttributeError):
+        msg.level = "USER"
+
+def test_ring_buffer_wraps_oldest_first():
+    """Test the web history ring buffer keeps the newest items in order."""
+    buf = daemon.RingBuffer(3)
+    assert len(buf) == 0 and buf.snapshot() == []
+
+    for i in range(5):
+        buf.append(i)
+    assert len(buf) == 3
+    assert buf.snapshot() == [2, 3, 4]
+    assert list(buf) == [2, 3, 4]
+
+    buf.clear()
+    buf.append("a")
+    assert buf.snapshot() == ["a"]
+
+@pytest.mark.asyncio
+async def test_fast_channel_backpressure():
+    """Test a bounded channel parks producers until the brain consumes."""
+    channel = daemon.FastChannel(maxsize=1)
+    await channel.put("a")
+    assert channel.full()
+    with pytest.raises(asyncio.QueueFull):
+        channel.put_nowait("b")
+
+    producer = asyncio.create_task(channel.put("b"))
+    await asyncio.sleep(0)
+    assert not producer.done()
+
+    assert await channel.get() == "a"
+    await asyncio.wait_for(producer, timeout=1)
+    assert await channel.get() == "b"
+    assert channel.empty() and not channel.full()
+
+@pytest.mark.asyncio
+async def test_skipped_heartbeat_is_silent(mock_dependencies, mock_api_app):
+    """Test a heartbeat judged unnecessary never reaches the dispatcher or the DB."""
+    mock_dependencies["rlm_engine"].check_heartbeat_necessity = AsyncMock(return_value=False)
+
+    async def send_heartbeat():
+        await mock_api_app.state.command_bus.put(
+            {"level": "USER", "message": "heartbeat trigger", "source": "HEARTBEAT"}
+        )
+        await asyncio.sleep(0.05)
+        raise asyncio.CancelledError()
+
+    with patch("auric.core.daemon.asyncio.Event.wait", side_effect=send_heartbeat):
+        await daemon.run_daemon(None, mock_api_app)
+
+    mock_dependencies["rlm_engine"].check_heartbeat_necessity.assert_awaited_once()
+    mock_dependencies["rlm_engine"].think.assert_not_called()
+    mock_dependencies["audit_logger"].log_chat_many.assert_not_called()
+    assert len(mock_api_app.state.web_chat_history) == 0
+
+def test_now_hms_cached_per_second():
+    """Test the console timestamp is formatted once per wall-clock second."""
+    with patch("auric.core.daemon.time.time", side_effect=[1000.1, 1000.9, 1001.0]), \
+         patch("auric.core.daemon.time.strftime", side_effect=["a", "b"]) as mock_strftime:
+        assert daemon._now_hms() == "a"
+        assert daemon._now_hms() == "a"
+        assert daemon._now_hms() == "b"
+    assert mock_strftime.call_count == 2
+
+def test_parse_duration_and_clock():
+    """Test the shared duration and HH:MM parsers."""
+    assert daemon._parse_duration("30m") == {"minutes": 30}
+    assert daemon._parse_duration("2d") == {"days": 2}
+    for bad in ("", "m", "invalidh", "10x", "-5m"):
+        assert daemon._parse_duration(bad) is None
+
+    assert daemon._parse_clock("04:00") == (4, 0)
+    assert daemon._parse_clock("23:59") == (23, 59)
+    for bad in ("invalid:time", "24:00", "12:60", "1200", ""):
+        assert daemon._parse_clock(bad) is None
+
+@pytest.mark.asyncio
+async def test_pact_session_lookup_cached(mock_dependencies, mock_api_app):
+    """Test the DB session check runs once per PACT session, not once per message."""
+    mock_event = MagicMock()
+    mock_event.platform = "telegram"
+    mock_event.sender_id = "42"
+    mock_event.content = "ping"
+    mock_event.metadata = {"author_name": "TgUser"}
+    mock_dependencies["session_router"].get_active_session_id = MagicMock(return_value="pact_sid")
+
+    async def send_messages():
+        for _ in range(3):
+            await mock_api_app.state.command_bus.put({"type": "user_query", "event": mock_event})
+        await asyncio.sleep(0.05)
+        raise asyncio.CancelledError()
+
+    with patch("auric.core.daemon.asyncio.Event.wait", side_effect=send_messages):
+        await daemon.run_daemon(None, mock_api_app)
+
+    mock_dependencies["audit_logger"].get_session.assert_awaited_once_with("pact_sid")
+    mock_dependencies["audit_logger"].create_session.assert_awaited_once()
+    assert "pact_sid" in mock_api_app.state.known_sessions
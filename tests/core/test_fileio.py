@@ -0,0 +1,44 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from auric.core.fileio import atomic_write_json
+
+
+def test_atomic_write_json_writes_compact_json(tmp_path):
+    path = tmp_path / "data.json"
+    atomic_write_json(path, {"a": 1, "b": [1, 2]})
+
+    assert path.read_text(encoding="utf-8") == '{"a":1,"b":[1,2]}'
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_atomic_write_json_keeps_old_file_on_failure(tmp_path):
+    path = tmp_path / "data.json"
+    atomic_write_json(path, {"old": True})
+
+    with patch("auric.core.fileio.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            atomic_write_json(path, {"new": True})
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"old": True}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_atomic_write_json_uses_unique_temp_files(tmp_path):
+    path = tmp_path / "data.json"
+    temp_paths = []
+    real_replace = os.replace
+
+    def record_replace(src, dst):
+        temp_paths.append(src)
+        real_replace(src, dst)
+
+    with patch("auric.core.fileio.os.replace", side_effect=record_replace):
+        atomic_write_json(path, {"n": 1})
+        atomic_write_json(path, {"n": 2})
+
+    assert temp_paths[0] != temp_paths[1]
+    assert all(p.parent == tmp_path for p in temp_paths)
+    assert json.loads(path.read_text(encoding="utf-8")) == {"n": 2}
@@ -4,14 +4,15 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from auric.core.heartbeat import HeartbeatManager, can_dream, run_dream_cycle_task, run_heartbeat_task
+from auric.core.heartbeat import HeartbeatBackoff, HeartbeatManager, _parse_active_hours, _resolved_path, can_dream, run_dream_cycle_task, run_heartbeat_task, run_wal_checkpoint_task
 
 @pytest.fixture(autouse=True)
 def reset_heartbeat_singleton():
-    """Resets the singleton instance before each test."""
-    HeartbeatManager._instance = None
+    """Gives each test a fresh singleton instance."""
+    original = HeartbeatManager._instance
+    HeartbeatManager._instance = HeartbeatManager()
     yield
-    HeartbeatManager._instance = None
+    HeartbeatManager._instance = original
 
 @pytest.fixture
 def mock_audit_logger():
@@ -88,6 +89,20 @@ async def test_run_dream_cycle_task_skipped():
         await run_dream_cycle_task()
         mock_perform.assert_not_called()
 
+@pytest.mark.asyncio
+async def test_run_wal_checkpoint_task_only_when_idle(mock_audit_logger):
+    mock_audit_logger.checkpoint = AsyncMock()
+    hb = HeartbeatManager.get_instance()
+
+    # Active user: the WAL is left alone
+    hb.touch()
+    await run_wal_checkpoint_task(mock_audit_logger)
+    mock_audit_logger.checkpoint.assert_not_called()
+
+    hb._last_active_timestamp = datetime.now() - timedelta(minutes=40)
+    await run_wal_checkpoint_task(mock_audit_logger)
+    mock_audit_logger.checkpoint.assert_awaited_once()
+
 @pytest.mark.asyncio
 async def test_run_dream_cycle_task_failure(caplog):
     with patch("auric.core.heartbeat.can_dream", return_value=True), \
@@ -128,6 +143,9 @@ async def test_run_heartbeat_task_active_hours(tmp_path, mock_config, mock_audit
         msg = await command_bus.get()
         assert msg["source"] == "HEARTBEAT"
         assert "Task 1" in msg["heartbeat_source_content"]
+        assert f"located at `{hb_file.resolve()}`" in msg["message"]
+        assert "```markdown\n- Task 1\n```" in msg["message"]
+        assert msg["session_id"].startswith("heartbeat-")
 
     # 2. Outside hours
     mock_config.agents.defaults.heartbeat.active_hours = "00:00-00:01" # Assuming it's not currently this minute
@@ -188,6 +206,26 @@ async def test_run_heartbeat_midnight_crossing(tmp_path, mock_config, mock_audit
             call_args = mock_audit_logger.log_heartbeat.call_args
             assert call_args.kwargs["status"] == "SKIPPED"
 
+def test_parse_active_hours():
+    _parse_active_hours.cache_clear()
+    assert _parse_active_hours("09:30-17:00") == (570, 1020)
+    assert _parse_active_hours("22:00-04:00") == (1320, 240)
+    # Parsed once per window string
+    _parse_active_hours("09:30-17:00")
+    assert _parse_active_hours.cache_info().hits == 1
+
+    with pytest.raises(ValueError):
+        _parse_active_hours("invalid-hours")
+
+def test_resolved_path_is_cached(tmp_path):
+    _resolved_path.cache_clear()
+    hb_file = tmp_path / "HEARTBEAT.md"
+    expected = str(hb_file.resolve())
+    assert _resolved_path(hb_file) == expected
+    with patch.object(Path, "resolve") as mock_resolve:
+        assert _resolved_path(hb_file) == expected
+        mock_resolve.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_run_heartbeat_parsing_error(mock_config, mock_audit_logger, caplog):
     mock_config.agents.defaults.heartbeat.active_hours = "invalid-hours"
@@ -201,6 +239,34 @@ async def test_run_heartbeat_parsing_error(mock_config, mock_audit_logger, caplo
         mock_audit_logger.log_heartbeat.assert_awaited()
         assert mock_audit_logger.log_heartbeat.call_args.kwargs["status"] == "ALIVE"
 
+@pytest.mark.asyncio
+async def test_run_heartbeat_reads_file_only_when_changed(tmp_path, mock_config, mock_audit_logger):
+    mock_root = tmp_path / ".auric"
+    mock_root.mkdir()
+    hb_file = mock_root / "HEARTBEAT.md"
+    hb_file.write_text("- Task 1")
+
+    hb = HeartbeatManager.get_instance()
+    hb.audit_logger = mock_audit_logger
+    mock_config.agents.defaults.heartbeat.active_hours = "00:00-23:59"
+
+    command_bus = asyncio.Queue()
+    with patch("auric.core.heartbeat.load_config", return_value=mock_config), \
+         patch("auric.core.heartbeat.AURIC_ROOT", mock_root):
+        await run_heartbeat_task(command_bus)
+        assert "Task 1" in (await command_bus.get())["heartbeat_source_content"]
+
+        # Unchanged file: served from the cache
+        with patch.object(Path, "read_text") as mock_read:
+            await run_heartbeat_task(command_bus)
+            mock_read.assert_not_called()
+        assert "Task 1" in (await command_bus.get())["heartbeat_source_content"]
+
+        # Edited file (different size): re-read
+        hb_file.write_text("- Task 1\n- Task 2")
+        await run_heartbeat_task(command_bus)
+        assert "Task 2" in (await command_bus.get())["heartbeat_source_content"]
+
 @pytest.mark.asyncio
 async def test_run_heartbeat_no_pending_tasks(tmp_path, mock_config, mock_audit_logger):
     mock_root = tmp_path / ".auric"
@@ -268,3 +334,39 @@ async def test_run_heartbeat_no_file(tmp_path, mock_config, mock_audit_logger):
         await run_heartbeat_task(asyncio.Queue())
         # Should just return without error
         pass
+
+def test_heartbeat_backoff_stretches_and_resets():
+    scheduler = MagicMock()
+    backoff = HeartbeatBackoff(scheduler, "heartbeat", base_seconds=600, max_seconds=1800)
+
+    backoff.record(False)
+    scheduler.reschedule_job.assert_called_with("heartbeat", trigger="interval", seconds=900)
+    backoff.record(False)
+    backoff.record(False)
+    assert backoff.interval_seconds == 1800 # Capped
+    scheduler.reschedule_job.reset_mock()
+    backoff.record(False)
+    scheduler.reschedule_job.assert_not_called() # Already at the cap
+
+    backoff.record(True)
+    assert backoff.idle_streak == 0
+    scheduler.reschedule_job.assert_called_once_with("heartbeat", trigger="interval", seconds=600)
+
+@pytest.mark.asyncio
+async def test_run_heartbeat_task_reports_to_backoff(tmp_path, mock_config, mock_audit_logger):
+    mock_root = tmp_path / ".auric"
+    mock_root.mkdir()
+    hb = HeartbeatManager.get_instance()
+    hb.audit_logger = mock_audit_logger
+    mock_config.agents.defaults.heartbeat.active_hours = "00:00-23:59"
+    backoff = MagicMock()
+
+    with patch("auric.core.heartbeat.load_config", return_value=mock_config), \
+         patch("auric.core.heartbeat.AURIC_ROOT", mock_root):
+        # No HEARTBEAT.md: nothing to wake the agent for
+        await run_heartbeat_task(asyncio.Queue(), backoff=backoff)
+        backoff.record.assert_called_once_with(False)
+
+        (mock_root / "HEARTBEAT.md").write_text("- Task 1")
+        await run_heartbeat_task(asyncio.Queue(), backoff=backoff)
+        backoff.record.assert_called_with(True)
@@ -14,10 +14,14 @@ def pairing_manager(temp_auric_root):
     with patch("auric.core.pairing.AURIC_ROOT", temp_auric_root):
         return PairingManager()
 
-def test_init_creates_dir(temp_auric_root):
+def test_first_save_creates_dir(temp_auric_root):
     with patch("auric.core.pairing.AURIC_ROOT", temp_auric_root):
         pm = PairingManager()
-        assert (temp_auric_root / "credentials").exists()
+        assert not (temp_auric_root / "credentials").exists()
+        assert pm.is_user_allowed("discord", "123") is False
+        assert not (temp_auric_root / "credentials").exists()
+
+        pm.create_request("discord", "123", "user1")
         assert (temp_auric_root / "credentials").is_dir()
 
 def test_get_pairing_file(pairing_manager, temp_auric_root):
@@ -131,3 +135,26 @@ def test_approve_request_success(pairing_manager):
 def test_approve_request_not_found(pairing_manager):
     assert pairing_manager.approve_request("discord", "NONEXISTENT") is None
 
+
+def test_paths_are_cached(pairing_manager):
+    assert pairing_manager._paths("discord") is pairing_manager._paths("discord")
+
+def test_is_user_allowed_reloads_only_when_file_changes(pairing_manager):
+    allow_file = pairing_manager._get_allow_file("discord")
+    pairing_manager._save_json(allow_file, {"123": "user1"})
+
+    assert pairing_manager.is_user_allowed("discord", "123") is True
+    with patch.object(pairing_manager, "_load_json", wraps=pairing_manager._load_json) as mock_load:
+        assert pairing_manager.is_user_allowed("discord", "123") is True
+        mock_load.assert_not_called()
+
+    # Approving a new user rewrites the file; the cache picks it up
+    code = pairing_manager.create_request("discord", "456", "user2")
+    pairing_manager.approve_request("discord", code)
+    assert pairing_manager.is_user_allowed("discord", "456") is True
+
+def test_is_user_allowed_accepts_config_set(pairing_manager):
+    allowed = frozenset({"123"})
+    assert pairing_manager.is_user_allowed("discord", "123", config_allowed=allowed) is True
+    assert pairing_manager.is_user_allowed("discord", "456", config_allowed=allowed) is False
+    assert pairing_manager._allow_cache == {}
@@ -201,3 +201,29 @@ def test_get_all_active_session_ids(router):
     
     sids = router.get_all_active_session_ids()
     assert sids == {s1, s2}
+
+
+async def test_saves_are_debounced_inside_event_loop(router):
+    router.get_active_session_id("c1")
+    router.get_active_session_id("c2")
+    router.start_new_session("c3")
+
+    # Nothing written yet: the three mutations share one pending flush
+    assert not router.storage_path.exists()
+    assert router._flush_handle is not None
+
+    router.flush_now()
+    assert router._flush_handle is None
+    data = json.loads(router.storage_path.read_text(encoding="utf-8"))
+    assert set(data["active_sessions"]) == {"c1", "c2", "c3"}
+    assert not router.storage_path.with_suffix(".json.tmp").exists()
+
+
+async def test_close_all_sessions_saves_immediately(router):
+    router.get_active_session_id("c1")
+    router.close_all_sessions()
+
+    assert router._flush_handle is None
+    data = json.loads(router.storage_path.read_text(encoding="utf-8"))
+    assert data["active_sessions"] == {}
+    assert data["closed_contexts"] == ["c1"]
@@ -83,13 +83,32 @@ def test_system_logger_log_structured(mock_config, tmp_path):
     assert "timestamp" in log_entry
 
 
+def test_system_logger_timestamp_reuses_formatted_second(mock_config):
+    mock_config.agents.defaults.logging.enabled = False
+    sl = SystemLogger(mock_config)
+
+    with patch("auric.core.system_logger.time.time", side_effect=[1600000000.25, 1600000000.5]):
+        first = sl._timestamp()
+        with patch("auric.core.system_logger.datetime") as mock_datetime:
+            second = sl._timestamp()
+            mock_datetime.fromtimestamp.assert_not_called()
+
+    base = datetime.fromtimestamp(1600000000).isoformat()
+    assert first == f"{base}.250000"
+    assert second == f"{base}.500000"
+    assert datetime.fromisoformat(second) == datetime.fromtimestamp(1600000000.5)
+
+
 def test_system_logger_log_disabled(mock_config, tmp_path):
     log_dir = tmp_path / "logs"
     mock_config.agents.defaults.logging.log_dir = str(log_dir)
     sl = SystemLogger(mock_config)
     
+    assert sl.enabled is True
+
     # Disable after init
     sl.config.agents.defaults.logging.enabled = False
+    assert sl.enabled is False
     sl.log("EVENT", {"data": 1})
     
     log_file = log_dir / "system.jsonl"
@@ -108,6 +127,22 @@ def test_jsonl_formatter_dict():
     assert json.loads(result) == payload
 
 
+def test_jsonl_formatter_dict_edge_cases():
+    formatter = JSONLFormatter()
+    record = MagicMock()
+    record.msg = {"path": Path("a.txt"), 1: "int key"}
+    assert json.loads(formatter.format(record)) == {"path": "a.txt", "1": "int key"}
+
+    # Beyond orjson's 64-bit range: falls back to the stdlib encoder
+    record.msg = {"big": 2 ** 70}
+    assert json.loads(formatter.format(record)) == {"big": 2 ** 70}
+
+    # Datetime values keep str()'s space separator, as json.dumps(default=str) wrote them
+    when = datetime(2024, 1, 2, 3, 4, 5)
+    record.msg = {"at": when}
+    assert json.loads(formatter.format(record)) == {"at": "2024-01-02 03:04:05"}
+
+
 def test_jsonl_formatter_string():
     formatter = JSONLFormatter()
     record = MagicMock()
@@ -0,0 +1,75 @@
+import asyncio
+
+from auric.interface.adapters.base import BasePact, PactEvent
+
+
+class DummyPact(BasePact):
+    async def start(self) -> None:
+        self._start_consumer()
+
+    async def stop(self) -> None:
+        await self._stop_consumer()
+
+    async def send_message(self, target_id: str, content: str) -> None:
+        pass
+
+
+def make_event(content: str) -> PactEvent:
+    return PactEvent(platform="dummy", sender_id="1", content=content)
+
+
+async def test_emit_queues_events_for_consumer_in_order():
+    pact = DummyPact()
+    received = []
+    release = asyncio.Event()
+
+    async def handler(event):
+        await release.wait()
+        received.append(event.content)
+
+    pact.on_message(handler)
+    await pact.start()
+
+    # _emit returns without waiting on the (blocked) handler
+    for i in range(3):
+        await asyncio.wait_for(pact._emit(make_event(str(i))), timeout=1)
+
+    release.set()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    await pact.stop()
+
+    assert received == ["0", "1", "2"]
+    assert pact._consumer_task is None
+
+
+async def test_emit_without_consumer_awaits_handler():
+    pact = DummyPact()
+    received = []
+
+    async def handler(event):
+        received.append(event.content)
+
+    pact.on_message(handler)
+    await pact._emit(make_event("direct"))
+    assert received == ["direct"]
+
+
+async def test_consumer_survives_handler_errors():
+    pact = DummyPact()
+    received = []
+
+    async def handler(event):
+        if event.content == "bad":
+            raise RuntimeError("boom")
+        received.append(event.content)
+
+    pact.on_message(handler)
+    await pact.start()
+    await pact._emit(make_event("bad"))
+    await pact._emit(make_event("good"))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    await pact.stop()
+
+    assert received == ["good"]
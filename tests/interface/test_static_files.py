@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from auric.interface.server.static_files import CachedStaticFiles
+
+
+def make_client(tmp_path):
+    (tmp_path / "index.html").write_text("<h1>Auric</h1>", encoding="utf-8")
+    (tmp_path / "app.js").write_text("console.log('hi');", encoding="utf-8")
+    app = FastAPI()
+    app.mount("/", CachedStaticFiles(directory=str(tmp_path), html=True), name="static")
+    return TestClient(app)
+
+
+def test_cached_static_files_serves_and_revalidates(tmp_path):
+    client = make_client(tmp_path)
+
+    first = client.get("/app.js")
+    assert first.status_code == 200
+    assert first.text == "console.log('hi');"
+    assert "javascript" in first.headers["content-type"]
+    etag = first.headers["etag"]
+
+    # Served from memory: the file on disk is not read again
+    with patch("anyio.Path.read_bytes") as mock_read:
+        second = client.get("/app.js")
+        mock_read.assert_not_called()
+    assert second.text == first.text
+    assert second.headers["etag"] == etag
+
+    not_modified = client.get("/app.js", headers={"if-none-match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+def test_cached_static_files_html_index_and_missing(tmp_path):
+    client = make_client(tmp_path)
+
+    assert client.get("/").text == "<h1>Auric</h1>"
+    assert client.get("/missing.css").status_code == 404
+    assert client.head("/app.js").status_code == 200
@@ -0,0 +1,43 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("telegram")
+
+from auric.interface.adapters.telegram import TelegramPact
+
+
+@pytest.fixture
+def pact():
+    pact = TelegramPact(token="test-token")
+    pact.application = MagicMock()
+    pact.application.bot.send_chat_action = AsyncMock()
+    pact._started = True
+    return pact
+
+
+async def test_typing_restarts_without_waiting_for_refresh(pact):
+    send = pact.application.bot.send_chat_action
+
+    await pact.trigger_typing("42")
+    assert send.await_count == 1
+
+    # Stop then trigger again mid-refresh: the action is resent right away
+    await pact.stop_typing("42")
+    await pact.trigger_typing("42")
+    await asyncio.wait_for(_until(lambda: send.await_count == 2), timeout=1)
+
+    # Once stopped, the loop parks on the gate instead of sending again
+    await pact.stop_typing("42")
+    await asyncio.sleep(0.05)
+    assert send.await_count == 2
+
+    task = pact._typing_tasks["42"]
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def _until(predicate):
+    while not predicate():
+        await asyncio.sleep(0)